@@ -8,7 +8,7 @@ import os
 # Ensure src is in python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
 
-from artist_tracker.tracker import main
+from artist_tracker.cli import main
 
 if __name__ == '__main__':
     main()
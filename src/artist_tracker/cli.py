@@ -3,8 +3,166 @@
 Spotify Release Tracker - CLI Entry Point
 
 This module provides the entry point for pip-installed command.
+
+Only argparse is imported here: --help and usage errors exit before the
+tracker module (spotipy, requests, the database) is loaded.
 """
-from artist_tracker.tracker import main
+import argparse
+import sys
+from typing import List, Optional
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments, printing help and exiting when no source is given.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        Parsed arguments for a command that should run
+    """
+    # Set up argument parser
+    parser = argparse.ArgumentParser(
+        description='Spotify Recent Release Tracker - Track new releases from playlists, artists, or your library',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Track from a playlist
+  python main.py track 37i9dQZF1DXcBWIGoYBM5M
+
+  # Track from multiple playlists
+  python main.py track 37i9dQZF1DXcBWIGoYBM5M 4j3i...
+
+  # Track from your "Liked Songs"
+  python main.py track --liked
+
+  # Track a single artist (demo)
+  python main.py track --artist="Megadeth"
+
+  # With options
+  python main.py track 37i9dQZF1DXcBWIGoYBM5M --days 30 --format pretty
+        """
+    )
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    # track command
+    parser_track = subparsers.add_parser(
+        'track',
+        help='Track recent releases'
+    )
+
+    # Arguments for track
+    parser_track.add_argument(
+        'playlists',
+        nargs='*',
+        help='Spotify playlist IDs, URIs, or URLs'
+    )
+
+    group = parser_track.add_mutually_exclusive_group()
+    group.add_argument(
+        '--liked',
+        action='store_true',
+        help='Track from your "Liked Songs" library'
+    )
+    group.add_argument(
+        '--artist',
+        help='Track a single artist by name or ID'
+    )
+
+    parser_track.add_argument(
+        '--format', '-f',
+        choices=['tsv', 'json', 'csv', 'pretty', 'ids'],
+        default='pretty', # Changed default to pretty for better UX as per user request
+        help='Output format: pretty (default), tsv, json, or csv'
+    )
+    parser_track.add_argument(
+        '--days', '-d',
+        type=int,
+        default=None,
+        help='Days to look back (default: 90)'
+    )
+    parser_track.add_argument(
+        '--since',
+        type=str,
+        default=None,
+        help='Start date in YYYY-MM-DD format (overrides --days)'
+    )
+    parser_track.add_argument(
+        '--max-per-artist', '-m',
+        type=int,
+        default=None,
+        help='Cap number of tracks per artist (uses popularity ranking)'
+    )
+    parser_track.add_argument(
+        '--profile',
+        action='store_true',
+        help='Enable performance profiling and show statistics'
+    )
+    parser_track.add_argument(
+        '--force-refresh',
+        action='store_true',
+        help='Bypass cache and fetch fresh data from API'
+    )
+    parser_track.add_argument(
+        '--workers', '-w', '--concurrency',
+        dest='workers',
+        type=int,
+        default=None,
+        help='Number of artists to fetch concurrently (default: MAX_WORKERS env var or 16)'
+    )
+    parser_track.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Enable verbose logging to console'
+    )
+    parser_track.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Incremental mode: only fetch releases since last run (optimized for weekly schedules)'
+    )
+    parser_track.add_argument(
+        '--delta-only',
+        action='store_true',
+        help='Delta-only: show only releases added since last run (requires database)'
+    )
+    parser_track.add_argument(
+        '--stream',
+        action='store_true',
+        help='Print tsv/csv rows as each artist finishes (unsorted) instead of after all fetches'
+    )
+    parser_track.add_argument(
+        '--show-activity',
+        action='store_true',
+        help='Show artist activity profiles (release frequency and recommendations)'
+    )
+
+    args = parser.parse_args(argv)
+
+    # Default to 'track' command and show help if no args provided
+    if not args.command:
+        parser.print_help()
+        sys.exit(0)
+
+    # For 'track' command, check if any source is provided
+    if args.command == 'track':
+        if not args.playlists and not args.liked and not args.artist:
+             # If no args provided to track, print help for track
+             parser_track.print_help()
+             sys.exit(0)
+
+    return args
+
+
+def main():
+    """Main entry point with CLI commands."""
+    args = parse_args()
+
+    # Heavy imports are deferred until a command will actually run
+    from artist_tracker.tracker import run
+    run(args)
+
 
 if __name__ == '__main__':
     main()
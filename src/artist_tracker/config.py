@@ -30,7 +30,7 @@ class TrackerConfig:
     ])
 
     # Performance Settings
-    max_workers: int = 8
+    max_workers: int = 16
     api_retry_attempts: int = 3
     retry_base_delay: float = 2.0
 
@@ -66,7 +66,7 @@ class TrackerConfig:
             client_secret=client_secret,
             market=os.getenv('SPOTIFY_MARKET', 'IL'),
             lookback_days=int(os.getenv('LOOKBACK_DAYS', '90')),
-            max_workers=int(os.getenv('MAX_WORKERS', '8')),
+            max_workers=int(os.getenv('MAX_WORKERS', '16')),
             api_retry_attempts=int(os.getenv('API_RETRY_ATTEMPTS', '3')),
             retry_base_delay=float(os.getenv('RETRY_BASE_DELAY', '2.0')),
             db_path=os.getenv('DB_PATH', 'artists.db'),
@@ -8,14 +8,74 @@ Manages SQLite database for storing tracked artists.
 import json
 import re
 import sqlite3
+import zlib
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import logging
 
 from .exceptions import DatabaseError, ValidationError
 
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install esh-tracker[fast])
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Row layout of the isrc_lookup_cache table (namedtuples carry no per-instance dict)
+ISRCCacheRow = namedtuple('ISRCCacheRow', 'isrc earliest_date earliest_album_name cached_at')
+
+_SQL_INSERT_ISRC = '''
+    INSERT OR REPLACE INTO isrc_lookup_cache
+    (isrc, earliest_date, earliest_album_name, cached_at)
+    VALUES (?, ?, ?, ?)
+'''
+
+_SQL_INSERT_RELEASE = '''
+    INSERT OR REPLACE INTO releases_cache
+    (artist_id, album_id, track_id, isrc, release_date, album_name,
+     track_name, album_type, popularity, spotify_url, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data):
+    """Deserialize JSON from bytes or str, using orjson when available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached_release_date(value: str) -> datetime:
+    """Parse a releases_cache date; memoized because tracks of one album share a date."""
+    return datetime.fromisoformat(value) if 'T' not in value else datetime.strptime(value, '%Y-%m-%d')
+
+
+def _release_row(release_data: dict, fetched_at: str) -> tuple:
+    """Build a releases_cache row from a release dictionary."""
+    return (
+        release_data.get('artist_id'),
+        release_data.get('album_id'),
+        release_data.get('track_id'),
+        release_data.get('isrc'),
+        release_data.get('release_date'),
+        release_data.get('album_name'),
+        release_data.get('track_name'),
+        release_data.get('album_type'),
+        release_data.get('popularity'),
+        release_data.get('spotify_url'),
+        fetched_at
+    )
+
 
 class ArtistDatabase:
     """Manages artist storage in SQLite database."""
@@ -23,15 +83,29 @@ class ArtistDatabase:
     # Spotify artist ID is base62 encoded, 22 characters
     SPOTIFY_ID_PATTERN = re.compile(r'^[a-zA-Z0-9]{22}$')
 
+    # Artists inserted per transaction when importing a backup
+    IMPORT_BATCH_SIZE = 1000
+
     def __init__(self, db_path: str = 'artists.db'):
         """
         Initialize the artist database.
 
         Args:
             db_path: Path to the SQLite database file
+
+        Raises:
+            DatabaseError: If the schema cannot be created or read
         """
         self.db_path = db_path
-        self._init_database()
+
+        # Validate schema once here so steady-state reads need no error handling
+        try:
+            self._init_database()
+
+            # In-memory mirror of isrc_lookup_cache; ISRC reads never touch the disk
+            self._isrc_shadow: Dict[str, Tuple[str, str]] = self._load_isrc_shadow()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to initialize database at {db_path}: {e}") from e
 
     @staticmethod
     def _validate_artist_name(artist_name: str) -> None:
@@ -75,10 +149,32 @@ class ArtistDatabase:
             raise ValidationError('spotify_artist_id', spotify_artist_id,
                                 'Spotify ID must be exactly 22 alphanumeric characters')
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Open a connection that commits (or rolls back) and closes on exit.
+
+        The database runs in WAL mode (set once in _init_database), where
+        synchronous=NORMAL is still crash-safe and avoids an fsync per commit.
+        Closing promptly lets the last connection checkpoint the WAL file.
+
+        Yields:
+            sqlite3.Connection
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('PRAGMA synchronous=NORMAL')
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
     def _init_database(self) -> None:
         """Create the database schema if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
+            # Persistent setting: readers no longer block the writer and commits are cheaper
+            cursor.execute('PRAGMA journal_mode=WAL')
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS artists (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -147,6 +243,34 @@ class ArtistDatabase:
                 )
             ''')
 
+            # Create artist lookup cache table (name searches and ID-to-name lookups)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS artist_lookup_cache (
+                    lookup_key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    cached_at TEXT NOT NULL
+                )
+            ''')
+
+            # Create empty artist cache (artists with no releases in a recent check)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS empty_artist_cache (
+                    artist_id TEXT PRIMARY KEY,
+                    cutoff_date TEXT NOT NULL,
+                    checked_at TEXT NOT NULL
+                )
+            ''')
+
+            # Create HTTP response cache (compressed body + ETag per request URL)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS http_response_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT NOT NULL DEFAULT '',
+                    body BLOB NOT NULL,
+                    cached_at TEXT NOT NULL
+                )
+            ''')
+
             # Create run history table for incremental updates
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS run_history (
@@ -170,6 +294,20 @@ class ArtistDatabase:
             conn.commit()
             logger.info(f"Database initialized at {self.db_path}")
 
+    def _load_isrc_shadow(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Load the ISRC lookup cache into memory.
+
+        Returns:
+            Dictionary mapping ISRC to (earliest_date, earliest_album_name)
+        """
+        with self._connect() as conn:
+            cursor = conn.execute('''
+                SELECT isrc, earliest_date, earliest_album_name
+                FROM isrc_lookup_cache
+            ''')
+            return {isrc: (date, album) for isrc, date, album in cursor}
+
     def add_artist(
         self,
         artist_name: str,
@@ -194,7 +332,7 @@ class ArtistDatabase:
         self._validate_spotify_id(spotify_artist_id)
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 date_added = datetime.now().isoformat()
 
@@ -218,24 +356,41 @@ class ArtistDatabase:
         artists: List[Tuple[str, str]]
     ) -> Tuple[int, int]:
         """
-        Add multiple artists to the database.
+        Add multiple artists to the database in a single transaction.
 
         Args:
             artists: List of tuples (artist_name, spotify_artist_id)
 
         Returns:
-            Tuple of (added_count, skipped_count)
-        """
-        added = 0
-        skipped = 0
+            Tuple of (added_count, skipped_count); existing artists are skipped
 
+        Raises:
+            ValidationError: If any input is invalid (nothing is written)
+            DatabaseError: If database operation fails
+        """
         for artist_name, spotify_artist_id in artists:
-            if self.add_artist(artist_name, spotify_artist_id):
-                added += 1
-            else:
-                skipped += 1
+            self._validate_artist_name(artist_name)
+            self._validate_spotify_id(spotify_artist_id)
 
-        return added, skipped
+        if not artists:
+            return 0, 0
+
+        date_added = datetime.now().isoformat()
+        try:
+            with self._connect() as conn:
+                changes_before = conn.total_changes
+                conn.executemany('''
+                    INSERT OR IGNORE INTO artists (date_added, artist_name, spotify_artist_id)
+                    VALUES (?, ?, ?)
+                ''', [(date_added, name, spotify_id) for name, spotify_id in artists])
+                conn.commit()
+                added = conn.total_changes - changes_before
+
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to add artists: {e}") from e
+
+        logger.info(f"Added {added} artists ({len(artists) - added} already present)")
+        return added, len(artists) - added
 
     def get_all_artists(self) -> List[Tuple[str, str, str, str]]:
         """
@@ -244,7 +399,7 @@ class ArtistDatabase:
         Returns:
             List of tuples (id, date_added, artist_name, spotify_artist_id)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT id, date_added, artist_name, spotify_artist_id
@@ -253,6 +408,20 @@ class ArtistDatabase:
             ''')
             return cursor.fetchall()
 
+    def iter_artists(self) -> Iterator[Tuple[str, str, str, str]]:
+        """
+        Yield artists one row at a time, in the same order as get_all_artists.
+
+        Yields:
+            Tuples (id, date_added, artist_name, spotify_artist_id)
+        """
+        with self._connect() as conn:
+            yield from conn.execute('''
+                SELECT id, date_added, artist_name, spotify_artist_id
+                FROM artists
+                ORDER BY date_added DESC
+            ''')
+
     def get_artist_ids(self) -> List[str]:
         """
         Get all Spotify artist IDs from the database.
@@ -260,7 +429,7 @@ class ArtistDatabase:
         Returns:
             List of Spotify artist IDs
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT spotify_artist_id FROM artists')
             return [row[0] for row in cursor.fetchall()]
@@ -275,7 +444,7 @@ class ArtistDatabase:
         Returns:
             Tuple of (id, date_added, artist_name, spotify_artist_id) or None
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT id, date_added, artist_name, spotify_artist_id
@@ -294,7 +463,7 @@ class ArtistDatabase:
         Returns:
             True if artist was removed, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 DELETE FROM artists
@@ -316,7 +485,7 @@ class ArtistDatabase:
         Returns:
             Number of artists in the database
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM artists')
             return cursor.fetchone()[0]
@@ -328,7 +497,7 @@ class ArtistDatabase:
         Returns:
             Number of artists removed
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM artists')
             count = cursor.fetchone()[0]
@@ -343,6 +512,10 @@ class ArtistDatabase:
         """
         Export database to JSON for backup.
 
+        Rows are streamed from the database to disk, so memory use does not grow
+        with the number of artists. A path ending in .ndjson is written as one
+        JSON object per line; anything else as a JSON array (one artist per line).
+
         Args:
             filepath: Path to output JSON file
 
@@ -352,22 +525,32 @@ class ArtistDatabase:
         Raises:
             DatabaseError: If export fails
         """
+        ndjson = filepath.endswith('.ndjson')
+        count = 0
+
         try:
-            artists = self.get_all_artists()
-            data = [
-                {
-                    'date_added': artist[1],
-                    'artist_name': artist[2],
-                    'spotify_artist_id': artist[3]
-                }
-                for artist in artists
-            ]
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                if not ndjson:
+                    f.write(b'[')
+
+                for _, date_added, artist_name, spotify_artist_id in self.iter_artists():
+                    record = _json_dumps({
+                        'date_added': date_added,
+                        'artist_name': artist_name,
+                        'spotify_artist_id': spotify_artist_id
+                    })
+
+                    if ndjson:
+                        f.write(record + b'\n')
+                    else:
+                        f.write((b',\n  ' if count else b'\n  ') + record)
+                    count += 1
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                if not ndjson:
+                    f.write(b'\n]\n' if count else b']\n')
 
-            logger.info(f"Exported {len(data)} artists to {filepath}")
-            return len(data)
+            logger.info(f"Exported {count} artists to {filepath}")
+            return count
 
         except Exception as e:
             raise DatabaseError(f"Failed to export to JSON: {e}") from e
@@ -376,8 +559,12 @@ class ArtistDatabase:
         """
         Import artists from JSON backup.
 
+        A path ending in .ndjson is read one line at a time. Artists are inserted
+        in batches of IMPORT_BATCH_SIZE, so a large backup is never held as one list
+        of rows.
+
         Args:
-            filepath: Path to input JSON file
+            filepath: Path to input JSON (array) or NDJSON file
 
         Returns:
             Tuple of (added_count, skipped_count)
@@ -387,15 +574,10 @@ class ArtistDatabase:
             ValidationError: If JSON data is invalid
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            added = skipped = 0
+            batch = []
 
-            if not isinstance(data, list):
-                raise ValidationError('json_data', type(data).__name__,
-                                    'JSON must contain an array of artists')
-
-            artists = []
-            for item in data:
+            for item in self._iter_json_records(filepath):
                 if not isinstance(item, dict):
                     logger.warning(f"Skipping invalid item: {item}")
                     continue
@@ -407,9 +589,14 @@ class ArtistDatabase:
                     logger.warning(f"Skipping incomplete item: {item}")
                     continue
 
-                artists.append((artist_name, spotify_id))
+                batch.append((artist_name, spotify_id))
+                if len(batch) >= self.IMPORT_BATCH_SIZE:
+                    batch_added, batch_skipped = self.add_artists_batch(batch)
+                    added, skipped = added + batch_added, skipped + batch_skipped
+                    batch.clear()
 
-            added, skipped = self.add_artists_batch(artists)
+            batch_added, batch_skipped = self.add_artists_batch(batch)
+            added, skipped = added + batch_added, skipped + batch_skipped
             logger.info(f"Imported from {filepath}: {added} added, {skipped} skipped")
             return added, skipped
 
@@ -420,6 +607,34 @@ class ArtistDatabase:
         except Exception as e:
             raise DatabaseError(f"Failed to import from JSON: {e}") from e
 
+    @staticmethod
+    def _iter_json_records(filepath: str) -> Iterator:
+        """
+        Yield records from a JSON array file or an NDJSON file.
+
+        Args:
+            filepath: Path to input file (.ndjson is read line by line)
+
+        Yields:
+            Decoded records
+
+        Raises:
+            ValidationError: If a JSON file does not contain an array
+        """
+        with open(filepath, 'rb') as f:
+            if filepath.endswith('.ndjson'):
+                for line in f:
+                    if line.strip():
+                        yield _json_loads(line)
+                return
+
+            data = _json_loads(f.read())
+
+        if not isinstance(data, list):
+            raise ValidationError('json_data', type(data).__name__,
+                                'JSON must contain an array of artists')
+        yield from data
+
     def cache_release(self, release_data: dict) -> bool:
         """
         Cache a release in the database.
@@ -434,35 +649,45 @@ class ArtistDatabase:
             DatabaseError: If caching fails
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                fetched_at = datetime.now().isoformat()
-
-                cursor.execute('''
-                    INSERT OR REPLACE INTO releases_cache
-                    (artist_id, album_id, track_id, isrc, release_date, album_name,
-                     track_name, album_type, popularity, spotify_url, fetched_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    release_data.get('artist_id'),
-                    release_data.get('album_id'),
-                    release_data.get('track_id'),
-                    release_data.get('isrc'),
-                    release_data.get('release_date'),
-                    release_data.get('album_name'),
-                    release_data.get('track_name'),
-                    release_data.get('album_type'),
-                    release_data.get('popularity'),
-                    release_data.get('spotify_url'),
-                    fetched_at
-                ))
-
+            with self._connect() as conn:
+                conn.execute(_SQL_INSERT_RELEASE, _release_row(release_data, datetime.now().isoformat()))
                 conn.commit()
                 return True
 
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to cache release: {e}") from e
 
+    def cache_releases_batch(self, releases: List[dict]) -> int:
+        """
+        Cache several releases in a single transaction.
+
+        Writing all of an artist's releases at once means an interrupted run
+        never leaves a partial set behind, so a re-run can resume from the
+        cache and skip every artist that was fully processed.
+
+        Args:
+            releases: List of release dictionaries (same keys as cache_release)
+
+        Returns:
+            Number of releases cached
+
+        Raises:
+            DatabaseError: If caching fails
+        """
+        if not releases:
+            return 0
+
+        fetched_at = datetime.now().isoformat()
+        try:
+            with self._connect() as conn:
+                conn.executemany(_SQL_INSERT_RELEASE,
+                                 [_release_row(release, fetched_at) for release in releases])
+                conn.commit()
+                return len(releases)
+
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to cache {len(releases)} releases: {e}") from e
+
     def _calculate_adaptive_ttl(self, artist_id: str) -> int:
         """
         Calculate adaptive cache TTL based on artist activity.
@@ -478,7 +703,7 @@ class ArtistDatabase:
             Cache TTL in hours
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Get the most recent release date for this artist
@@ -492,7 +717,7 @@ class ArtistDatabase:
                     return 24  # Default to 24 hours if no data
 
                 last_release_str = result[0]
-                last_release_date = datetime.fromisoformat(last_release_str) if 'T' not in last_release_str else datetime.strptime(last_release_str, '%Y-%m-%d')
+                last_release_date = _parse_cached_release_date(last_release_str)
 
                 days_since_release = (datetime.now() - last_release_date).days
 
@@ -516,7 +741,7 @@ class ArtistDatabase:
             Datetime of last run, or None if no runs recorded
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT run_timestamp FROM run_history
@@ -547,7 +772,7 @@ class ArtistDatabase:
             api_calls_made: Number of API calls made
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT INTO run_history
@@ -579,7 +804,7 @@ class ArtistDatabase:
             List of run history dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT run_timestamp, artists_tracked, releases_found,
@@ -619,7 +844,7 @@ class ArtistDatabase:
             - recommended_check_interval_days: Suggested check frequency
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Get all releases for this artist
@@ -632,8 +857,7 @@ class ArtistDatabase:
                 releases = []
                 for row in cursor.fetchall():
                     try:
-                        releases.append(datetime.fromisoformat(row[0]) if 'T' not in row[0]
-                                      else datetime.strptime(row[0], '%Y-%m-%d'))
+                        releases.append(_parse_cached_release_date(row[0]))
                     except:
                         pass
 
@@ -705,7 +929,7 @@ class ArtistDatabase:
             return self.get_cached_releases(artist_id, cutoff_date)
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT artist_id, album_id, track_id, isrc, release_date, album_name,
@@ -752,7 +976,7 @@ class ArtistDatabase:
             List of cached release dictionaries, or empty list if cache is stale
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 # Use adaptive TTL if not specified
@@ -809,7 +1033,7 @@ class ArtistDatabase:
             Number of entries cleared
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 from datetime import timedelta
@@ -843,7 +1067,7 @@ class ArtistDatabase:
             Number of entries cleared
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('''
@@ -876,48 +1100,270 @@ class ArtistDatabase:
             True if cached successfully
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cached_at = datetime.now().isoformat()
+            with self._connect() as conn:
+                conn.execute(_SQL_INSERT_ISRC,
+                             (isrc, earliest_date, earliest_album_name, datetime.now().isoformat()))
+                conn.commit()
+                self._isrc_shadow[isrc] = (earliest_date, earliest_album_name)
+                return True
 
-                cursor.execute('''
-                    INSERT OR REPLACE INTO isrc_lookup_cache
-                    (isrc, earliest_date, earliest_album_name, cached_at)
-                    VALUES (?, ?, ?, ?)
-                ''', (isrc, earliest_date, earliest_album_name, cached_at))
+        except sqlite3.Error as e:
+            logger.error(f"Error caching ISRC lookup for '{isrc}': {e}")
+            return False
+
+    def cache_isrc_lookups_batch(self, lookups: List[Tuple[str, str, str]]) -> int:
+        """
+        Cache multiple ISRC lookup results in a single transaction.
 
+        Args:
+            lookups: List of tuples (isrc, earliest_date, earliest_album_name)
+
+        Returns:
+            Number of rows written (0 on failure)
+        """
+        if not lookups:
+            return 0
+
+        cached_at = datetime.now().isoformat()
+        rows = [ISRCCacheRow(isrc, date, album, cached_at) for isrc, date, album in lookups]
+
+        try:
+            with self._connect() as conn:
+                conn.executemany(_SQL_INSERT_ISRC, rows)
+                conn.commit()
+                self._isrc_shadow.update(
+                    (row.isrc, (row.earliest_date, row.earliest_album_name)) for row in rows
+                )
+                return len(rows)
+
+        except sqlite3.Error as e:
+            logger.error(f"Error caching {len(rows)} ISRC lookups: {e}")
+            return 0
+
+    def cache_artist_lookup(self, lookup_key: str, value: str) -> bool:
+        """
+        Cache an artist lookup result (search -> ID or ID -> name).
+
+        Args:
+            lookup_key: Namespaced key, e.g. 'search:megadeth' or 'artist:<id>'
+            value: Resolved artist ID or name
+
+        Returns:
+            True if cached successfully
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO artist_lookup_cache (lookup_key, value, cached_at)
+                    VALUES (?, ?, ?)
+                ''', (lookup_key, value, datetime.now().isoformat()))
                 conn.commit()
                 return True
 
         except sqlite3.Error as e:
-            logger.error(f"Error caching ISRC lookup for '{isrc}': {e}")
+            logger.error(f"Error caching artist lookup for '{lookup_key}': {e}")
             return False
 
-    def get_cached_isrc_lookup(self, isrc: str) -> Optional[Tuple[str, str]]:
+    def get_cached_artist_lookup(self, lookup_key: str, max_age_hours: Optional[int] = 168) -> Optional[str]:
         """
-        Get cached ISRC lookup result.
+        Get a cached artist lookup result if it is still fresh.
 
         Args:
-            isrc: International Standard Recording Code
+            lookup_key: Namespaced key, e.g. 'search:megadeth' or 'artist:<id>'
+            max_age_hours: Maximum age of the entry in hours (default: 7 days);
+                None accepts an entry of any age
 
         Returns:
-            Tuple of (earliest_date, earliest_album_name) or None if not cached
+            Cached artist ID or name, or None if missing or stale
         """
+        from datetime import timedelta
+        if max_age_hours is None:
+            cache_expiry = ''
+        else:
+            cache_expiry = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._connect() as conn:
+                row = conn.execute('''
+                    SELECT value FROM artist_lookup_cache
+                    WHERE lookup_key = ? AND cached_at >= ?
+                ''', (lookup_key, cache_expiry)).fetchone()
+                return row[0] if row else None
 
-                cursor.execute('''
-                    SELECT earliest_date, earliest_album_name
-                    FROM isrc_lookup_cache
-                    WHERE isrc = ?
-                ''', (isrc,))
-
-                row = cursor.fetchone()
-                if row:
-                    return (row[0], row[1])
-                return None
+        except sqlite3.Error as e:
+            logger.error(f"Error fetching artist lookup for '{lookup_key}': {e}")
+            return None
+
+    def mark_artists_empty(self, artist_ids: List[str], cutoff_date: str) -> int:
+        """
+        Record artists that had no releases on or after cutoff_date.
+
+        Args:
+            artist_ids: Spotify artist IDs
+            cutoff_date: Cutoff date the check covered (YYYY-MM-DD)
+
+        Returns:
+            Number of artists recorded (0 on failure)
+        """
+        if not artist_ids:
+            return 0
+
+        checked_at = datetime.now().isoformat()
+        try:
+            with self._connect() as conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO empty_artist_cache (artist_id, cutoff_date, checked_at)
+                    VALUES (?, ?, ?)
+                ''', [(artist_id, cutoff_date, checked_at) for artist_id in artist_ids])
+                conn.commit()
+                return len(artist_ids)
+
+        except sqlite3.Error as e:
+            logger.error(f"Error marking {len(artist_ids)} artists as empty: {e}")
+            return 0
+
+    def get_empty_artists(self, cutoff_date: str, max_age_hours: int = 24) -> Set[str]:
+        """
+        Get artists recently found to have no releases in a window covering cutoff_date.
+
+        An entry only applies if its check used the same or an earlier cutoff, so
+        widening the lookback window re-checks every artist.
+
+        Args:
+            cutoff_date: Cutoff date of the current run (YYYY-MM-DD)
+            max_age_hours: Maximum age of an entry in hours (default: 24)
+
+        Returns:
+            Set of Spotify artist IDs that can be skipped
+        """
+        from datetime import timedelta
+        cache_expiry = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute('''
+                    SELECT artist_id FROM empty_artist_cache
+                    WHERE cutoff_date <= ? AND checked_at >= ?
+                ''', (cutoff_date, cache_expiry))
+                return {row[0] for row in cursor}
 
         except sqlite3.Error as e:
-            logger.error(f"Error fetching cached ISRC lookup for '{isrc}': {e}")
+            logger.error(f"Error fetching empty artists: {e}")
+            return set()
+
+    def cache_http_response(self, url: str, etag: str, body: bytes) -> bool:
+        """
+        Store a response body (and its ETag, if any) for a request URL.
+
+        Args:
+            url: Full request URL including query string
+            etag: ETag header returned with the response, or '' if none
+            body: Raw response body (stored zlib-compressed)
+
+        Returns:
+            True if cached successfully
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO http_response_cache (url, etag, body, cached_at)
+                    VALUES (?, ?, ?, ?)
+                ''', (url, etag or '', zlib.compress(body), datetime.now().isoformat()))
+                conn.commit()
+                return True
+
+        except sqlite3.Error as e:
+            logger.error(f"Error caching response for '{url}': {e}")
+            return False
+
+    def get_http_response(self, url: str) -> Optional[Tuple[str, bytes, float]]:
+        """
+        Get the stored response for a request URL.
+
+        Args:
+            url: Full request URL including query string
+
+        Returns:
+            Tuple of (etag, body, age_seconds) or None if not cached
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT etag, body, cached_at FROM http_response_cache WHERE url = ?', (url,)
+                ).fetchone()
+                if not row:
+                    return None
+                age = (datetime.now() - datetime.fromisoformat(row[2])).total_seconds()
+                return (row[0], zlib.decompress(row[1]), age)
+
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.error(f"Error fetching cached response for '{url}': {e}")
             return None
+
+    def touch_http_response(self, url: str) -> bool:
+        """
+        Mark a stored response as fresh again (after a 304 Not Modified).
+
+        Args:
+            url: Full request URL including query string
+
+        Returns:
+            True if an entry was updated
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    'UPDATE http_response_cache SET cached_at = ? WHERE url = ?',
+                    (datetime.now().isoformat(), url)
+                )
+                conn.commit()
+                return cursor.rowcount > 0
+
+        except sqlite3.Error as e:
+            logger.error(f"Error refreshing cached response for '{url}': {e}")
+            return False
+
+    def clear_expired_http_responses(self, max_age_seconds: int) -> int:
+        """
+        Delete stored responses not refreshed within max_age_seconds.
+
+        Batched request URLs change whenever their ID set does, so old entries
+        would otherwise accumulate without bound.
+
+        Args:
+            max_age_seconds: Maximum age of an entry in seconds
+
+        Returns:
+            Number of entries deleted
+        """
+        from datetime import timedelta
+        expiry_time = (datetime.now() - timedelta(seconds=max_age_seconds)).isoformat()
+
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    'DELETE FROM http_response_cache WHERE cached_at < ?', (expiry_time,)
+                )
+                deleted = cursor.rowcount
+
+                if deleted > 0:
+                    logger.info(f"Cleared {deleted} expired HTTP responses")
+
+                return deleted
+
+        except sqlite3.Error as e:
+            logger.error(f"Error clearing expired HTTP responses: {e}")
+            return 0
+
+    def get_cached_isrc_lookup(self, isrc: str) -> Optional[Tuple[str, str]]:
+        """
+        Get cached ISRC lookup result.
+
+        Args:
+            isrc: International Standard Recording Code
+
+        Returns:
+            Tuple of (earliest_date, earliest_album_name) or None if not cached
+        """
+        # Served from the in-memory mirror; writes keep it in sync with the table
+        return self._isrc_shadow.get(isrc)
@@ -8,23 +8,31 @@ Uses SQLite for caching.
 """
 
 import argparse
+import heapq
+import itertools
 import logging
 import os
+import random
 import re
 import sys
+import threading
 import time
 from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 from dotenv import load_dotenv
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import spotipy
 from spotipy.exceptions import SpotifyException
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyClientCredentials, SpotifyOAuth
 from tqdm import tqdm
+from .cli import parse_args
 from .database import ArtistDatabase
 from .exceptions import (
     ArtistNotFoundError,
@@ -35,6 +43,11 @@ from .exceptions import (
 )
 from .profiler import PerformanceStats, ProfilerContext
 
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install esh-tracker[fast])
+    orjson = None
+
 
 # Configure logging
 def setup_logging(verbose: bool = False):
@@ -48,8 +61,11 @@ def setup_logging(verbose: bool = False):
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
     
-    # Clear any existing handlers
-    root_logger.handlers = []
+    # Replace any existing handlers, closing them so repeated calls don't leak
+    # open app.log file handles
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
     
     # File handler - always logs INFO
     file_handler = logging.FileHandler('app.log')
@@ -65,19 +81,126 @@ def setup_logging(verbose: bool = False):
 
 logger = logging.getLogger(__name__)
 
+# Sort keys for release dicts (itemgetter avoids a Python-level call per comparison)
+_BY_RELEASE_DATE = itemgetter('release_date')
+_BY_POPULARITY = itemgetter('popularity')
+
+
+@lru_cache(maxsize=4096)
+def _strptime_release_date(date_str: str) -> datetime:
+    """Parse a normalized YYYY-MM-DD date; memoized since album dates repeat."""
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+class ConditionalRequestSession(requests.Session):
+    """
+    Session that caches large, rarely-changing GETs in a persistent response store.
+
+    Each cacheable endpoint has a TTL (see CACHE_TTLS). Within the TTL the stored
+    body is served without touching the network; once stale, the request is
+    revalidated with If-None-Match and a 304 Not Modified refreshes the entry and
+    is answered from the stored body, so unchanged pages cost a round-trip but no
+    transfer.
+    """
+
+    # (URL pattern, TTL in seconds); a TTL of 0 always revalidates
+    CACHE_TTLS = (
+        (re.compile(r'/v1/artists/[^/]+/albums'), 3600),
+        (re.compile(r'/v1/albums/?\?'), 30 * 24 * 3600),
+        # Track objects carry popularity, which drives --max-per-artist ranking
+        (re.compile(r'/v1/tracks/?\?'), 24 * 3600),
+        (re.compile(r'/v1/playlists/[^/]+/tracks'), 0),
+    )
+
+    # Entries older than the longest TTL can no longer be served and are pruned
+    MAX_CACHE_AGE = max(ttl for _, ttl in CACHE_TTLS)
+
+    def __init__(self, response_store=None, refresh: bool = False, rate_limiter=None):
+        """
+        Initialize the session.
+
+        Args:
+            response_store: Object with get_http_response/cache_http_response/
+                            touch_http_response (e.g. ArtistDatabase); caching is
+                            disabled when None
+            refresh: If True, never answer from the store but still update it
+            rate_limiter: Optional object with acquire() (e.g. TokenBucket), called
+                          only for requests that go to the network
+        """
+        super().__init__()
+        self.response_store = response_store
+        self.refresh = refresh
+        self.rate_limiter = rate_limiter
+
+    def _send_request(self, method, url, **kwargs) -> requests.Response:
+        """Send a request over the network, waiting on the rate limiter first."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().request(method, url, **kwargs)
+
+    def _ttl_for(self, url: str) -> Optional[int]:
+        """Return the cache TTL for a URL, or None if it is not cacheable."""
+        for pattern, ttl in self.CACHE_TTLS:
+            if pattern.search(url):
+                return ttl
+        return None
+
+    def _cached_response(self, url: str, body: bytes) -> requests.Response:
+        """Build a 200 response around a stored body, running the session's hooks."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.encoding = 'utf-8'
+        response.url = url
+        return requests.hooks.dispatch_hook('response', self.hooks, response)
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        ttl = self._ttl_for(url) if self.response_store is not None else None
+        if ttl is None or method.upper() != 'GET':
+            return self._send_request(method, url, params=params, headers=headers, **kwargs)
+
+        cache_url = requests.Request('GET', url, params=params).prepare().url
+        cached = None if self.refresh else self.response_store.get_http_response(cache_url)
+
+        if cached and cached[2] < ttl:
+            return self._cached_response(cache_url, cached[1])
+
+        headers = dict(headers or {})
+        if cached and cached[0]:
+            headers['If-None-Match'] = cached[0]
+
+        response = self._send_request(method, url, params=params, headers=headers, **kwargs)
+
+        if response.status_code == 304 and cached:
+            self.response_store.touch_http_response(cache_url)
+            response.status_code = 200
+            response._content = cached[1]
+        elif response.status_code == 200:
+            self.response_store.cache_http_response(
+                cache_url, response.headers.get('ETag', ''), response.content
+            )
+
+        return response
 
-def create_optimized_session(pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+
+def create_optimized_session(pool_connections: int = 10, pool_maxsize: int = 20,
+                             response_store=None, refresh_cache: bool = False,
+                             rate_limiter=None) -> requests.Session:
     """
     Create a requests session with connection pooling and retry logic.
 
     Args:
         pool_connections: Number of connection pools to cache
         pool_maxsize: Maximum number of connections to save in the pool
+        response_store: Optional persistent response cache (see ConditionalRequestSession)
+        refresh_cache: If True, bypass cached responses but still store fresh ones
+        rate_limiter: Optional limiter acquired before each network request
+                      (cached responses don't consume it)
 
     Returns:
         Configured requests.Session with connection pooling
     """
-    session = requests.Session()
+    session = ConditionalRequestSession(response_store, refresh=refresh_cache, rate_limiter=rate_limiter)
 
     # Configure retry strategy
     retry_strategy = Retry(
@@ -97,11 +220,26 @@ def create_optimized_session(pool_connections: int = 10, pool_maxsize: int = 20)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
+    # spotipy decodes every response with response.json(); use orjson when available
+    if orjson is not None:
+        session.hooks['response'].append(_use_orjson_decoder)
+
     return session
 
 
+def _use_orjson_decoder(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """
+    Response hook that makes response.json() decode with orjson.
+
+    orjson.JSONDecodeError subclasses ValueError, so callers that handle
+    undecodable bodies keep working.
+    """
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
 class LRUCache:
-    """Simple LRU (Least Recently Used) cache implementation."""
+    """Simple LRU (Least Recently Used) cache implementation, safe to share across threads."""
 
     def __init__(self, capacity: int = 1000):
         """
@@ -112,6 +250,8 @@ class LRUCache:
         """
         self.cache = OrderedDict()
         self.capacity = capacity
+        # ISRC lookups run on the io pool; guard the check-then-move/evict sequences
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[any]:
         """
@@ -123,12 +263,13 @@ class LRUCache:
         Returns:
             Cached value or None if not found
         """
-        if key not in self.cache:
-            return None
+        with self._lock:
+            if key not in self.cache:
+                return None
 
-        # Move to end (most recently used)
-        self.cache.move_to_end(key)
-        return self.cache[key]
+            # Move to end (most recently used)
+            self.cache.move_to_end(key)
+            return self.cache[key]
 
     def put(self, key: str, value: any) -> None:
         """
@@ -138,26 +279,178 @@ class LRUCache:
             key: Cache key
             value: Value to cache
         """
-        if key in self.cache:
-            # Update existing key and move to end
-            self.cache.move_to_end(key)
-        else:
-            # Add new key
-            if len(self.cache) >= self.capacity:
-                # Remove oldest (first) item
-                self.cache.popitem(last=False)
+        with self._lock:
+            if key in self.cache:
+                # Update existing key and move to end
+                self.cache.move_to_end(key)
+            else:
+                # Add new key
+                if len(self.cache) >= self.capacity:
+                    # Remove oldest (first) item
+                    self.cache.popitem(last=False)
 
-        self.cache[key] = value
+            self.cache[key] = value
 
     def clear(self) -> None:
         """Clear all cached items."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
 
     def size(self) -> int:
         """Return current cache size."""
         return len(self.cache)
 
 
+class TokenBucket:
+    """Thread-safe token bucket that paces calls shared across worker threads."""
+
+    def __init__(self, rate_per_sec: float = 10.0, burst: int = 20):
+        """
+        Initialize token bucket (starts full).
+
+        Args:
+            rate_per_sec: Tokens added per second
+            burst: Maximum number of tokens held at once
+        """
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """
+        Take tokens from the bucket, blocking until enough are available.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    wait_time = self._resume_at - now
+                else:
+                    self._tokens = min(
+                        self.burst,
+                        self._tokens + (now - self._last_refill) * self.rate_per_sec
+                    )
+                    self._last_refill = now
+
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+
+                    wait_time = (tokens - self._tokens) / self.rate_per_sec
+
+            # Sleep outside the lock so other workers can refill and check
+            time.sleep(wait_time)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all callers for a while (e.g. after a 429 with Retry-After).
+
+        The bucket resumes empty, so traffic restarts at the steady rate
+        rather than with a burst.
+
+        Args:
+            seconds: How long acquire() should block for every caller
+        """
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            if resume_at > self._resume_at:
+                self._resume_at = resume_at
+                self._last_refill = resume_at
+                self._tokens = 0.0
+
+
+class SharedTokenAuthManager:
+    """
+    Wraps a spotipy auth manager so worker threads share one cached access token.
+
+    spotipy checks token expiry on every request and refreshes without a lock, so
+    several workers can refresh at once. Here the token is read lock-free while
+    valid, and only one thread refreshes it.
+    """
+
+    # Refresh this many seconds before the token actually expires
+    REFRESH_MARGIN = 120
+    # spotipy's own is_token_expired threshold; it hands back the cached token until then
+    SPOTIPY_EXPIRY_THRESHOLD = 60
+
+    def __init__(self, auth_manager):
+        """
+        Initialize the wrapper.
+
+        Args:
+            auth_manager: spotipy auth manager (SpotifyClientCredentials or SpotifyOAuth)
+        """
+        self._auth_manager = auth_manager
+        self._lock = threading.Lock()
+        self._token: Tuple[Optional[str], float] = (None, 0.0)  # (access_token, refresh_at)
+        self._rejected = False  # Spotify returned 401 for the current token
+
+    def get_access_token(self, as_dict: bool = False):
+        """
+        Return the shared access token, refreshing it if it is about to expire.
+
+        Args:
+            as_dict: If True, delegate to the wrapped manager (token info dict)
+
+        Returns:
+            Access token string
+        """
+        if as_dict:
+            with self._lock:
+                return self._auth_manager.get_access_token(as_dict=True)
+
+        token, refresh_at = self._token
+        if token and time.time() < refresh_at:
+            return token
+
+        with self._lock:
+            # Another worker may have refreshed while we waited
+            token, refresh_at = self._token
+            if token and time.time() < refresh_at:
+                return token
+
+            if self._rejected or token:
+                # Rejected, or inside REFRESH_MARGIN: the wrapped manager would still
+                # return the cached token, so bypass its expiry check
+                self._force_refresh()
+                self._rejected = False
+
+            token = self._auth_manager.get_access_token(as_dict=False)
+            token_info = self._auth_manager.cache_handler.get_cached_token() or {}
+            expires_at = token_info.get('expires_at', time.time() + 3600)
+            refresh_at = expires_at - self.REFRESH_MARGIN
+            if refresh_at <= time.time():
+                # The new token expires no later than the old one; keep it until
+                # spotipy's threshold instead of refreshing on every call
+                refresh_at = expires_at - self.SPOTIPY_EXPIRY_THRESHOLD
+            self._token = (token, refresh_at)
+            return token
+
+    def invalidate(self) -> None:
+        """Discard the shared token after Spotify rejected it; the next call fetches a new one."""
+        with self._lock:
+            self._token = (None, 0.0)
+            self._rejected = True
+
+    def _force_refresh(self) -> None:
+        """Replace the wrapped manager's cached token, bypassing its expiry check."""
+        token_info = self._auth_manager.cache_handler.get_cached_token() or {}
+        if token_info.get('refresh_token') and hasattr(self._auth_manager, 'refresh_access_token'):
+            # OAuth: use the refresh token rather than re-running the authorization flow
+            self._auth_manager.refresh_access_token(token_info['refresh_token'])
+        else:
+            self._auth_manager.get_access_token(as_dict=False, check_cache=False)
+
+    def __getattr__(self, name):
+        return getattr(self._auth_manager, name)
+
+
 class DummyContext:
     """Dummy context manager that does nothing (for when profiler is disabled)."""
     def __enter__(self):
@@ -175,17 +468,57 @@ class SpotifyReleaseTracker:
         'instrumental', 'karaoke'
     ]
 
+    # Whole-word match with plural/past-tense suffixes ('Remastered', 'Demos'),
+    # so words that merely contain a keyword ('Delivery', 'Alive') are kept
+    _NOISE_RE = re.compile(
+        r'\b(?:' + '|'.join(map(re.escape, NOISE_KEYWORDS)) + r')(?:s|ed)?\b',
+        re.IGNORECASE
+    )
+
     # Lookback window in days
     LOOKBACK_DAYS = 90
 
     # API retry configuration
     MAX_RETRIES = 3
     RETRY_BASE_DELAY = 2.0  # seconds
+    RETRY_MAX_DELAY = 60.0  # seconds, cap for exponential backoff
+
+    # Maximum IDs accepted by Spotify's several-tracks / several-albums endpoints
+    TRACKS_BATCH_SIZE = 50
+    ALBUMS_BATCH_SIZE = 20
+
+    # Prefix of artist URIs accepted as input (spotify:artist:<id>)
+    _ARTIST_URI_PREFIX = 'spotify:artist:'
+
+    # Playlist ID inside an open.spotify.com URL
+    _PLAYLIST_URL_RE = re.compile(r'playlist/([a-zA-Z0-9]+)')
+
+    # Playlist fields needed to collect artists (plus paging info)
+    PLAYLIST_ITEM_FIELDS = 'items(track(artists(id,name))),total,limit'
+
+    # Album groups to fetch, in the order Spotify returns them
+    ALBUM_GROUPS = ('album', 'single', 'compilation')
+
+    # Default number of artists fetched concurrently (requests are IO-bound;
+    # the shared rate limiter keeps the overall request rate in check)
+    MAX_WORKERS = 16
+
+    # Proactive rate limit shared by all workers (keeps us under Spotify's window)
+    RATE_LIMIT_PER_SEC = 10.0
+    RATE_LIMIT_BURST = 20
+
+    # Hours to remember that an artist search found nothing before trying again
+    SEARCH_MISS_TTL_HOURS = 24
+
+    # Below this many artists a run is short enough that a progress bar costs
+    # more (one stderr write per artist) than it tells the user
+    PROGRESS_BAR_MIN_ARTISTS = 50
 
     def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
                  lookback_days: Optional[int] = None, profiler: Optional[PerformanceStats] = None,
                  db: Optional[ArtistDatabase] = None, force_refresh: bool = False,
-                 spotify_client=None, auth_manager=None, incremental: bool = False):
+                 spotify_client=None, auth_manager=None, incremental: bool = False,
+                 max_workers: Optional[int] = None):
         """
         Initialize the tracker with Spotify credentials.
 
@@ -199,13 +532,32 @@ class SpotifyReleaseTracker:
             spotify_client: Optional pre-configured Spotify client (for testing/mocking)
             auth_manager: Optional pre-configured auth manager (e.g., SpotifyOAuth)
             incremental: If True, only fetch releases since last run (for weekly schedules)
+            max_workers: Optional number of artists fetched concurrently (default: 16)
         """
+        self.max_workers = max_workers if max_workers is not None else self.MAX_WORKERS
+
+        # Keep at least one pooled connection per worker so requests never queue on the pool
+        pool_maxsize = max(20, self.max_workers)
+
+        # Proactive rate limit for Spotify requests. A session we create draws from
+        # it per network request, so cached responses are free; an injected
+        # client is limited per call in _call_api instead.
+        self._limiter = TokenBucket(self.RATE_LIMIT_PER_SEC, self.RATE_LIMIT_BURST)
+
+        # Pooled HTTP session owned by this tracker (None for an injected client)
+        self._session: Optional[requests.Session] = None
+
+        # Spotify responses are cached in the database; force_refresh skips reads only
         if spotify_client is not None:
             self.sp = spotify_client
         elif auth_manager is not None:
             # Use optimized session with connection pooling
-            optimized_session = create_optimized_session()
-            self.sp = spotipy.Spotify(auth_manager=auth_manager, requests_session=optimized_session)
+            self._session = create_optimized_session(
+                pool_maxsize=pool_maxsize, response_store=db, refresh_cache=force_refresh,
+                rate_limiter=self._limiter
+            )
+            self.sp = spotipy.Spotify(auth_manager=SharedTokenAuthManager(auth_manager),
+                                      requests_session=self._session)
         else:
             if not client_id or not client_secret:
                  raise ValueError("Must provide client_id and client_secret if no client/auth_manager provided")
@@ -214,8 +566,12 @@ class SpotifyReleaseTracker:
                 client_secret=client_secret
             )
             # Use optimized session with connection pooling
-            optimized_session = create_optimized_session()
-            self.sp = spotipy.Spotify(auth_manager=auth_manager, requests_session=optimized_session)
+            self._session = create_optimized_session(
+                pool_maxsize=pool_maxsize, response_store=db, refresh_cache=force_refresh,
+                rate_limiter=self._limiter
+            )
+            self.sp = spotipy.Spotify(auth_manager=SharedTokenAuthManager(auth_manager),
+                                      requests_session=self._session)
 
         self.incremental = incremental
 
@@ -242,11 +598,57 @@ class SpotifyReleaseTracker:
         # Initialize in-memory cache for releases (LRU with 1000 item capacity)
         self._memory_cache = LRUCache(capacity=1000)
 
+        # Shared pool for page and ISRC requests, created on first use (see _io_executor)
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._io_pool_lock = threading.Lock()
+
         logger.info(f"Initialized tracker with cutoff date: {self.cutoff_date.date()} ({self.lookback_days} days)")
 
+    @property
+    def cutoff_date_str(self) -> str:
+        """
+        Cutoff date as YYYY-MM-DD, always derived from cutoff_date.
+
+        ISO dates sort correctly as strings, so most cutoff checks need no parsing.
+        """
+        return self.cutoff_date.strftime('%Y-%m-%d')
+
+    def _io_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool shared by page fetches and ISRC searches.
+
+        Its tasks are single API calls that never submit further work, so artist
+        workers can wait on it without risk of deadlock. Reusing one pool avoids
+        starting fresh threads for every artist.
+
+        Returns:
+            ThreadPoolExecutor with max_workers threads
+        """
+        if self._io_pool is None:
+            with self._io_pool_lock:
+                if self._io_pool is None:
+                    self._io_pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='spotify-io'
+                    )
+        return self._io_pool
+
+    def close(self) -> None:
+        """Shut down the shared request thread pool, close pooled HTTP connections and prune old responses."""
+        with self._io_pool_lock:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
+                self._io_pool = None
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+            if self.db:
+                self.db.clear_expired_http_responses(ConditionalRequestSession.MAX_CACHE_AGE)
+
     def _call_api(self, endpoint: str, func, *args, **kwargs):
         """
-        Call Spotify API and record in profiler if enabled.
+        Call Spotify API, waiting on the shared rate limiter, and record in profiler if enabled.
 
         Args:
             endpoint: Name of the API endpoint for profiling
@@ -260,8 +662,23 @@ class SpotifyReleaseTracker:
         if self.profiler:
             self.profiler.record_api_call(endpoint)
 
+        # Our own session rate-limits at the network layer, skipping cache hits
+        if self._session is None:
+            self._limiter.acquire()
         return func(*args, **kwargs)
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter, so concurrent workers don't retry in lockstep.
+
+        Args:
+            attempt: Zero-based retry attempt
+
+        Returns:
+            Seconds to wait, uniformly drawn from [0, min(RETRY_MAX_DELAY, base * 2^attempt)]
+        """
+        return random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * (2 ** attempt)))
+
     def _retry_on_error(self, func, *args, max_retries: int = None, **kwargs):
         """
         Retry a function call with exponential backoff on error.
@@ -283,6 +700,7 @@ class SpotifyReleaseTracker:
             max_retries = self.MAX_RETRIES
 
         last_exception = None
+        token_refreshed = False
 
         for attempt in range(max_retries + 1):
             try:
@@ -299,7 +717,10 @@ class SpotifyReleaseTracker:
                         f"(attempt {attempt + 1}/{max_retries + 1})"
                     )
                     if attempt < max_retries:
-                        time.sleep(retry_after)
+                        # Stop the other workers too, instead of each one hitting the limit
+                        self._limiter.pause(retry_after)
+                        # Workers throttled together get the same header; spread their wake-ups
+                        time.sleep(retry_after + random.uniform(0, 1.0))
                         continue
                     else:
                         raise RateLimitError(retry_after=retry_after) from e
@@ -307,9 +728,9 @@ class SpotifyReleaseTracker:
                 # Handle server errors (5xx)
                 elif e.http_status and 500 <= e.http_status < 600:
                     if attempt < max_retries:
-                        wait_time = self.RETRY_BASE_DELAY * (2 ** attempt)
+                        wait_time = self._backoff_delay(attempt)
                         logger.warning(
-                            f"Server error ({e.http_status}). Retrying in {wait_time}s "
+                            f"Server error ({e.http_status}). Retrying in {wait_time:.1f}s "
                             f"(attempt {attempt + 1}/{max_retries + 1})"
                         )
                         time.sleep(wait_time)
@@ -318,6 +739,14 @@ class SpotifyReleaseTracker:
                         raise SpotifyAPIError(f"Server error after {max_retries} retries: {e}",
                                             status_code=e.http_status) from e
 
+                # Token revoked or expired early: refresh once and retry
+                elif (e.http_status == 401 and attempt < max_retries and not token_refreshed
+                      and isinstance(getattr(self.sp, 'auth_manager', None), SharedTokenAuthManager)):
+                    logger.warning("Access token rejected (401). Refreshing token and retrying")
+                    self.sp.auth_manager.invalidate()
+                    token_refreshed = True
+                    continue
+
                 # Handle other HTTP errors
                 elif e.http_status and 400 <= e.http_status < 500:
                     # Client errors shouldn't be retried
@@ -326,9 +755,9 @@ class SpotifyReleaseTracker:
                 # Handle network errors
                 else:
                     if attempt < max_retries:
-                        wait_time = self.RETRY_BASE_DELAY * (2 ** attempt)
+                        wait_time = self._backoff_delay(attempt)
                         logger.warning(
-                            f"Network error: {e}. Retrying in {wait_time}s "
+                            f"Network error: {e}. Retrying in {wait_time:.1f}s "
                             f"(attempt {attempt + 1}/{max_retries + 1})"
                         )
                         time.sleep(wait_time)
@@ -361,13 +790,29 @@ class SpotifyReleaseTracker:
             return None, None
 
         # Check if it's a Spotify URI
-        if line.startswith('spotify:artist:'):
-            artist_id = line.split(':')[-1]
-            return artist_id, None
+        if line.startswith(self._ARTIST_URI_PREFIX):
+            return line[len(self._ARTIST_URI_PREFIX):], None
 
         # Otherwise treat as artist name
         return None, line
 
+    @staticmethod
+    def _normalize_release_date(date_str: str) -> str:
+        """
+        Pad partial release dates to YYYY-MM-DD.
+
+        Args:
+            date_str: Release date string (YYYY, YYYY-MM, or YYYY-MM-DD)
+
+        Returns:
+            Date string in YYYY-MM-DD form (other input is returned unchanged)
+        """
+        if len(date_str) == 4:
+            return f"{date_str}-01-01"
+        if len(date_str) == 7:
+            return f"{date_str}-01"
+        return date_str
+
     def _parse_release_date(self, date_str: str) -> Optional[datetime]:
         """
         Parse release date handling partial dates.
@@ -379,17 +824,7 @@ class SpotifyReleaseTracker:
             Datetime object or None if parsing fails
         """
         try:
-            # Handle year only (e.g., "2024")
-            if len(date_str) == 4:
-                return datetime.strptime(f"{date_str}-01-01", "%Y-%m-%d")
-
-            # Handle year-month (e.g., "2024-03")
-            elif len(date_str) == 7:
-                return datetime.strptime(f"{date_str}-01", "%Y-%m-%d")
-
-            # Handle full date (e.g., "2024-03-15")
-            else:
-                return datetime.strptime(date_str, "%Y-%m-%d")
+            return _strptime_release_date(self._normalize_release_date(date_str))
 
         except ValueError as e:
             logger.warning(f"Failed to parse date '{date_str}': {e}")
@@ -405,11 +840,62 @@ class SpotifyReleaseTracker:
         Returns:
             True if title contains noise keywords
         """
-        title_lower = title.lower()
-        for keyword in self.NOISE_KEYWORDS:
-            if keyword in title_lower:
-                return True
-        return False
+        return bool(self._NOISE_RE.search(title))
+
+    def _get_cached_artist_lookup(self, lookup_key: str) -> Optional[str]:
+        """
+        Check memory cache, then persistent cache, for an artist lookup.
+
+        Args:
+            lookup_key: Namespaced key, e.g. 'search:megadeth' or 'artist:<id>'
+
+        Returns:
+            Cached artist ID or name, or None on miss (always None with force_refresh)
+        """
+        if self.force_refresh:
+            return None
+
+        cached = self._memory_cache.get(lookup_key)
+        if cached is None and self.db:
+            cached = self.db.get_cached_artist_lookup(lookup_key)
+            if cached is not None:
+                self._memory_cache.put(lookup_key, cached)
+
+        if self.profiler:
+            if cached is not None:
+                self.profiler.record_cache_hit()
+            else:
+                self.profiler.record_cache_miss()
+        return cached
+
+    def _get_stale_artist_lookup(self, lookup_key: str) -> Optional[str]:
+        """
+        Get a persisted artist lookup regardless of age, for use when the API fails.
+
+        Artist IDs and names practically never change, so an expired entry is
+        still a better answer than an error.
+
+        Args:
+            lookup_key: Namespaced key, e.g. 'search:megadeth' or 'artist:<id>'
+
+        Returns:
+            Cached artist ID or name, or None if never cached
+        """
+        if not self.db:
+            return None
+        return self.db.get_cached_artist_lookup(lookup_key, max_age_hours=None)
+
+    def _cache_artist_lookup(self, lookup_key: str, value: str) -> None:
+        """
+        Store an artist lookup in memory and persistent caches.
+
+        Args:
+            lookup_key: Namespaced key, e.g. 'search:megadeth' or 'artist:<id>'
+            value: Resolved artist ID or name
+        """
+        self._memory_cache.put(lookup_key, value)
+        if self.db:
+            self.db.cache_artist_lookup(lookup_key, value)
 
     def _search_artist(self, artist_name: str) -> Optional[str]:
         """
@@ -424,6 +910,19 @@ class SpotifyReleaseTracker:
         Raises:
             SpotifyAPIError: If API call fails after retries
         """
+        normalized_name = artist_name.strip().lower()
+        lookup_key = f"search:{normalized_name}"
+        cached_id = self._get_cached_artist_lookup(lookup_key)
+        if cached_id:
+            return cached_id
+
+        # Don't repeat a search that recently came back empty
+        miss_key = f"search-miss:{normalized_name}"
+        if self.db and not self.force_refresh and self.db.get_cached_artist_lookup(
+                miss_key, max_age_hours=self.SEARCH_MISS_TTL_HOURS):
+            logger.info(f"Skipping search for '{artist_name}' - not found on a recent run")
+            return None
+
         def search_call():
             return self._call_api('search_artist', self.sp.search,
                 q=f'artist:{artist_name}',
@@ -438,12 +937,20 @@ class SpotifyReleaseTracker:
                 artist = results['artists']['items'][0]
                 artist_id = artist['id']
                 logger.info(f"Found artist '{artist['name']}' (ID: {artist_id})")
+                self._cache_artist_lookup(lookup_key, artist_id)
+                self._cache_artist_lookup(f"artist:{artist_id}", artist['name'])
                 return artist_id
             else:
                 logger.warning(f"No results found for artist '{artist_name}'")
+                if self.db:
+                    self.db.cache_artist_lookup(miss_key, artist_name)
                 return None
 
         except (SpotifyAPIError, RateLimitError) as e:
+            stale_id = self._get_stale_artist_lookup(lookup_key)
+            if stale_id:
+                logger.warning(f"Using previously cached ID for artist '{artist_name}' after API error: {e}")
+                return stale_id
             logger.error(f"API error searching for artist '{artist_name}': {e}")
             raise
         except Exception as e:
@@ -460,14 +967,26 @@ class SpotifyReleaseTracker:
         Returns:
             Artist name or None if not found
         """
+        lookup_key = f"artist:{artist_id}"
+        cached_name = self._get_cached_artist_lookup(lookup_key)
+        if cached_name:
+            return cached_name
+
         try:
             artist = self._call_api('artist', self.sp.artist, artist_id)
+            self._cache_artist_lookup(lookup_key, artist['name'])
             return artist['name']
         except Exception as e:
+            stale_name = self._get_stale_artist_lookup(lookup_key)
+            if stale_name:
+                logger.warning(f"Using previously cached name for artist ID '{artist_id}' after error: {e}")
+                return stale_name
             logger.error(f"Error fetching artist ID '{artist_id}': {e}")
             return None
 
-    def _get_earliest_release_info(self, isrc: str) -> Tuple[Optional[datetime], Optional[str]]:
+    def _get_earliest_release_info(
+        self, isrc: str, persist: bool = True
+    ) -> Tuple[Optional[datetime], Optional[str]]:
         """
         Find the earliest release date and album for a track by searching all instances via ISRC.
 
@@ -476,6 +995,7 @@ class SpotifyReleaseTracker:
 
         Args:
             isrc: International Standard Recording Code for the track
+            persist: If False, leave writing the result to the database to the caller
 
         Returns:
             Tuple of (earliest_date, original_album_name), or (None, None) if search fails
@@ -535,7 +1055,7 @@ class SpotifyReleaseTracker:
                 )
 
                 # Cache in persistent storage if database is available
-                if self.db:
+                if self.db and persist:
                     try:
                         self.db.cache_isrc_lookup(isrc, earliest_date.strftime('%Y-%m-%d'), earliest_album_name)
                     except Exception as cache_error:
@@ -554,6 +1074,149 @@ class SpotifyReleaseTracker:
             self._isrc_info_cache[isrc] = result
             return None, None
 
+    def _get_earliest_release_infos(
+        self, isrcs: List[str]
+    ) -> Dict[str, Tuple[Optional[datetime], Optional[str]]]:
+        """
+        Look up earliest release info for several ISRCs concurrently.
+
+        Args:
+            isrcs: Unique ISRCs to resolve
+
+        Returns:
+            Dict mapping each ISRC to (earliest_date, original_album_name)
+        """
+        if len(isrcs) <= 1:
+            return {isrc: self._get_earliest_release_info(isrc) for isrc in isrcs}
+
+        info = dict(zip(isrcs, self._io_executor().map(
+            lambda isrc: self._get_earliest_release_info(isrc, persist=False), isrcs
+        )))
+
+        # Persist newly searched results in one transaction
+        if self.db:
+            new_lookups = [
+                (isrc, earliest_date.strftime('%Y-%m-%d'), album_name)
+                for isrc, (earliest_date, album_name) in info.items()
+                if earliest_date and album_name and self.db.get_cached_isrc_lookup(isrc) is None
+            ]
+            self.db.cache_isrc_lookups_batch(new_lookups)
+
+        return info
+
+    def _get_album_tracks(self, album_ids: List[str]) -> Tuple[Dict[str, List[Dict]], bool]:
+        """
+        Fetch track listings for albums in batches of ALBUMS_BATCH_SIZE.
+
+        Full album objects embed the first page of tracks, so most albums need no
+        further request. For longer ones the embedded page reports total and limit,
+        so the remaining pages of all albums are requested concurrently.
+
+        Args:
+            album_ids: Spotify album IDs
+
+        Returns:
+            Tuple of (dictionary mapping album ID to its simplified track objects,
+            True if every batch and page was fetched); albums in failed batches or
+            with a failed track page are omitted
+        """
+        album_tracks: Dict[str, List[Dict]] = {}
+        extra_pages: List[Tuple[str, int, int]] = []
+        complete = True
+
+        for start in range(0, len(album_ids), self.ALBUMS_BATCH_SIZE):
+            chunk = album_ids[start:start + self.ALBUMS_BATCH_SIZE]
+            try:
+                response = self._retry_on_error(self._call_api, 'albums', self.sp.albums, chunk)
+            except Exception as e:
+                logger.warning(f"Error fetching {len(chunk)} albums: {e}")
+                complete = False
+                continue
+
+            for album in response.get('albums') or []:
+                if not album:
+                    continue
+
+                tracks_page = album['tracks']
+                tracks = list(tracks_page['items'])
+                album_tracks[album['id']] = tracks
+                if not tracks_page.get('next'):
+                    continue
+
+                page_size = tracks_page.get('limit')
+                if page_size and tracks_page.get('total'):
+                    extra_pages.extend(
+                        (album['id'], offset, page_size)
+                        for offset in range(page_size, tracks_page['total'], page_size)
+                    )
+                else:
+                    # No paging metadata: follow next links one by one
+                    try:
+                        while tracks_page.get('next'):
+                            tracks_page = self._retry_on_error(
+                                self._call_api, 'album_tracks_next', self.sp.next, tracks_page
+                            )
+                            tracks.extend(tracks_page['items'])
+                    except Exception as e:
+                        logger.warning(f"Error fetching tracks of album {album['id']}: {e}")
+                        del album_tracks[album['id']]
+                        complete = False
+
+        if extra_pages:
+            def fetch_page(page: Tuple[str, int, int]) -> Optional[Dict]:
+                album_id, offset, page_size = page
+                try:
+                    return self._retry_on_error(
+                        self._call_api, 'album_tracks_page', self.sp.album_tracks,
+                        album_id, limit=page_size, offset=offset
+                    )
+                except Exception as e:
+                    logger.warning(f"Error fetching tracks of album {album_id} at offset {offset}: {e}")
+                    return None
+
+            # executor.map yields pages in (album, offset) order
+            pages = self._io_executor().map(fetch_page, extra_pages)
+            for (album_id, _, _), page in zip(extra_pages, pages):
+                if album_id not in album_tracks:
+                    continue
+                if page is None:
+                    # A partial track listing would hide the missing tracks, so drop the album
+                    del album_tracks[album_id]
+                    complete = False
+                    continue
+                album_tracks[album_id].extend(page['items'])
+
+        return album_tracks, complete
+
+    def _get_full_tracks(self, track_ids: List[str]) -> Tuple[Dict[str, Dict], bool]:
+        """
+        Fetch full track objects in batches of TRACKS_BATCH_SIZE.
+
+        Args:
+            track_ids: Spotify track IDs
+
+        Returns:
+            Tuple of (dictionary mapping track ID to full track object,
+            True if every batch was fetched); failed batches are omitted
+        """
+        full_tracks: Dict[str, Dict] = {}
+        complete = True
+
+        for start in range(0, len(track_ids), self.TRACKS_BATCH_SIZE):
+            chunk = track_ids[start:start + self.TRACKS_BATCH_SIZE]
+            try:
+                response = self._retry_on_error(self._call_api, 'tracks', self.sp.tracks, chunk)
+            except Exception as e:
+                logger.warning(f"Error fetching track details for {len(chunk)} tracks: {e}")
+                complete = False
+                continue
+
+            for full_track in response.get('tracks') or []:
+                if full_track:
+                    full_tracks[full_track['id']] = full_track
+
+        return full_tracks, complete
+
     def _get_recent_releases(
         self,
         artist_id: str,
@@ -571,7 +1234,7 @@ class SpotifyReleaseTracker:
         Returns:
             List of release dictionaries with deduplication
         """
-        cutoff_date_str = self.cutoff_date.strftime('%Y-%m-%d')
+        cutoff_date_str = self.cutoff_date_str
         cache_key = f"{artist_id}:{cutoff_date_str}"
 
         # Check memory cache first (fastest)
@@ -585,7 +1248,7 @@ class SpotifyReleaseTracker:
                 # Apply max_tracks cap if specified
                 releases = memory_cached
                 if max_tracks and len(releases) > max_tracks:
-                    releases = sorted(releases, key=lambda x: x['popularity'], reverse=True)[:max_tracks]
+                    releases = heapq.nlargest(max_tracks, releases, key=_BY_POPULARITY)
 
                 return releases
 
@@ -621,8 +1284,7 @@ class SpotifyReleaseTracker:
 
                 # Apply max_tracks cap if specified
                 if max_tracks and len(releases) > max_tracks:
-                    releases.sort(key=lambda x: x['popularity'], reverse=True)
-                    releases = releases[:max_tracks]
+                    releases = heapq.nlargest(max_tracks, releases, key=_BY_POPULARITY)
 
                 return releases
             else:
@@ -632,44 +1294,52 @@ class SpotifyReleaseTracker:
         seen_isrcs: Set[str] = set()
         releases = []
 
+        # Bound once; these run for every album and track below
+        normalize_date = self._normalize_release_date
+        is_noise = self._is_noise
+        final_group = self.ALBUM_GROUPS[-1]
+
         try:
             # Get all album types with pagination and early stopping
             with ProfilerContext(self.profiler, 'fetch_artist_albums') if self.profiler else DummyContext():
                 albums_response = self._call_api('artist_albums', self.sp.artist_albums,
                     artist_id,
-                    album_type='album,single,compilation',
+                    album_type=','.join(self.ALBUM_GROUPS),
                     limit=50
                 )
 
             albums_to_process = []
-            # Process first page - collect albums within cutoff date
-            for album in albums_response['items']:
-                release_date = self._parse_release_date(album['release_date'])
-                if not release_date:
-                    continue
+            # False once any page or batch fails, so an empty result isn't trusted
+            fetched_all = True
+            while True:
+                reached_old_final_group = False
 
-                # Skip old albums, but DON'T stop pagination
-                # Note: Spotify groups albums by type (albums, singles, compilations),
-                # NOT by date, so we must continue checking all pages
-                if release_date >= self.cutoff_date:
-                    albums_to_process.append((album, release_date))
+                for album in albums_response['items']:
+                    release_date = normalize_date(album['release_date'])
 
-            # Fetch remaining pages
-            while albums_response['next']:
-                try:
-                    albums_response = self._call_api('artist_albums_next', self.sp.next, albums_response)
+                    if release_date >= cutoff_date_str:
+                        # Only in-window dates are parsed, to reject malformed values
+                        if self._parse_release_date(release_date):
+                            albums_to_process.append((album, release_date))
+                        continue
 
-                    for album in albums_response['items']:
-                        release_date = self._parse_release_date(album['release_date'])
-                        if not release_date:
-                            continue
+                    # Spotify groups albums by type (albums, singles, compilations) and
+                    # sorts by date only within a group, so an old album or single says
+                    # nothing about later pages. Once the final group is past the cutoff,
+                    # everything after it is older too.
+                    album_group = album.get('album_group') or album.get('album_type')
+                    if album_group == final_group:
+                        reached_old_final_group = True
+                        break
 
-                        # Skip old albums, but continue pagination
-                        if release_date >= self.cutoff_date:
-                            albums_to_process.append((album, release_date))
+                if reached_old_final_group or not albums_response['next']:
+                    break
 
+                try:
+                    albums_response = self._call_api('artist_albums_next', self.sp.next, albums_response)
                 except Exception as e:
                     logger.warning(f"Error fetching next page of albums for '{artist_name}': {e}")
+                    fetched_all = False
                     break
 
             logger.debug(f"Processing {len(albums_to_process)} albums for '{artist_name}'")
@@ -678,119 +1348,135 @@ class SpotifyReleaseTracker:
             # Note: Parallel processing is complex due to shared state (seen_isrcs)
             # The current sequential approach is safer and still benefits from
             # connection pooling and caching optimizations
+            wanted_albums = []
             for album, release_date in albums_to_process:
-
                 # Check for noise in album title
-                if self._is_noise(album['name']):
+                if is_noise(album['name']):
                     logger.info(
                         f"Skipping '{album['name']}' - contains noise keyword"
                     )
                     continue
+                wanted_albums.append((album, release_date))
 
-                # Get tracks from album
-                album_id = album['id']
-                tracks_response = self._call_api('album_tracks', self.sp.album_tracks, album_id)
-                tracks = tracks_response['items']
+            # Get track listings for all albums in batched requests
+            album_tracks, albums_complete = self._get_album_tracks([album['id'] for album, _ in wanted_albums])
 
-                for track in tracks:
+            candidate_tracks = []
+            for album, release_date in wanted_albums:
+                for track in album_tracks.get(album['id'], []):
                     # Check for noise in track title
-                    if self._is_noise(track['name']):
+                    if is_noise(track['name']):
                         logger.info(
                             f"Skipping track '{track['name']}' - contains noise keyword"
                         )
                         continue
+                    candidate_tracks.append((album, release_date, track))
 
-                    # Get ISRC for deduplication
-                    # Need to fetch full track details for ISRC and popularity
-                    try:
-                        full_track = self._call_api('track', self.sp.track, track['id'])
-                        isrc = full_track.get('external_ids', {}).get('isrc')
-                        popularity = full_track.get('popularity', 0)
-
-                        # Filter out tracks not by this artist (e.g., compilation albums)
-                        track_artist_ids = [artist['id'] for artist in full_track.get('artists', [])]
-                        if artist_id not in track_artist_ids:
-                            logger.debug(
-                                f"Skipping track '{track['name']}' - not by {artist_name} "
-                                f"(appears on compilation)"
+            # Fetch full track details (ISRC, popularity, artists) in batches
+            full_tracks, tracks_complete = self._get_full_tracks([track['id'] for _, _, track in candidate_tracks])
+            fetched_all = fetched_all and albums_complete and tracks_complete
+
+            # Resolve earliest release info for this artist's ISRCs concurrently
+            isrc_info = self._get_earliest_release_infos(list(dict.fromkeys(
+                full_track['external_ids']['isrc']
+                for full_track in full_tracks.values()
+                if full_track.get('external_ids', {}).get('isrc')
+                and any(artist['id'] == artist_id for artist in full_track.get('artists', []))
+            )))
+
+            for album, release_date, track in candidate_tracks:
+                album_id = album['id']
+                full_track = full_tracks.get(track['id'])
+                if not full_track:
+                    logger.warning(f"No track details returned for '{track['name']}'")
+                    continue
+
+                try:
+                    isrc = full_track.get('external_ids', {}).get('isrc')
+                    popularity = full_track.get('popularity', 0)
+
+                    # Filter out tracks not by this artist (e.g., compilation albums)
+                    track_artist_ids = [artist['id'] for artist in full_track.get('artists', [])]
+                    if artist_id not in track_artist_ids:
+                        logger.debug(
+                            f"Skipping track '{track['name']}' - not by {artist_name} "
+                            f"(appears on compilation)"
+                        )
+                        continue
+
+                    if isrc:
+                        if isrc in seen_isrcs:
+                            logger.info(
+                                f"Skipped track '{track['name']}' because "
+                                f"ISRC '{isrc}' was already seen"
                             )
                             continue
-
-                        if isrc:
-                            if isrc in seen_isrcs:
-                                logger.info(
-                                    f"Skipped track '{track['name']}' because "
-                                    f"ISRC '{isrc}' was already seen"
+                        seen_isrcs.add(isrc)
+
+                        # Earliest release info via ISRC search (resolved above)
+                        earliest_date, original_album = isrc_info[isrc]
+                        if earliest_date:
+                            # Use earliest date, but still apply the same inclusive
+                            # string cutoff as the album scan
+                            track_release_date = earliest_date.strftime('%Y-%m-%d')
+                            if track_release_date < cutoff_date_str:
+                                logger.debug(
+                                    f"Skipping track '{track['name']}' - "
+                                    f"original release {track_release_date} before cutoff"
                                 )
                                 continue
-                            seen_isrcs.add(isrc)
-
-                            # Find earliest release info via ISRC search
-                            earliest_date, original_album = self._get_earliest_release_info(isrc)
-                            if earliest_date:
-                                # Use earliest date, but still apply cutoff filter
-                                if earliest_date < self.cutoff_date:
-                                    logger.debug(
-                                        f"Skipping track '{track['name']}' - "
-                                        f"original release {earliest_date.date()} before cutoff"
-                                    )
-                                    continue
-                                track_release_date = earliest_date
-                                track_album_name = original_album or album['name']
-                            else:
-                                track_release_date = release_date
-                                track_album_name = album['name']
+                            track_album_name = original_album or album['name']
                         else:
-                            # No ISRC, use album release date
                             track_release_date = release_date
                             track_album_name = album['name']
+                    else:
+                        # No ISRC, use album release date
+                        track_release_date = release_date
+                        track_album_name = album['name']
 
-                        releases.append({
-                            'artist': artist_name,
-                            'album': track_album_name,
-                            'track': track['name'],
-                            'release_date': track_release_date.strftime('%Y-%m-%d'),
-                            'album_type': album['album_type'],
-                            'isrc': isrc or 'N/A',
-                            'spotify_url': full_track['external_urls']['spotify'],
-                            'popularity': popularity,
-                            # Internal IDs for caching
-                            'artist_id': artist_id,
-                            'album_id': album_id,
-                            'track_id': track['id']
-                        })
+                    releases.append({
+                        'artist': artist_name,
+                        'album': track_album_name,
+                        'track': track['name'],
+                        'release_date': track_release_date,
+                        # Only a handful of distinct values; share one string object
+                        'album_type': sys.intern(album['album_type']),
+                        'isrc': isrc or 'N/A',
+                        'spotify_url': full_track['external_urls']['spotify'],
+                        'popularity': popularity,
+                        # Internal IDs for caching
+                        'artist_id': artist_id,
+                        'album_id': album_id,
+                        'track_id': track['id']
+                    })
 
-                    except Exception as e:
-                        logger.warning(
-                            f"Error fetching track details for '{track['name']}': {e}"
-                        )
-                        continue
+                except Exception as e:
+                    logger.warning(
+                        f"Error processing track '{track['name']}': {e}"
+                    )
+                    continue
 
             # Apply max_tracks cap using popularity ranking
             if max_tracks and len(releases) > max_tracks:
                 logger.info(
                     f"Capping {len(releases)} releases to top {max_tracks} by popularity for '{artist_name}'"
                 )
-                releases.sort(key=lambda x: x['popularity'], reverse=True)
-                releases = releases[:max_tracks]
+                releases = heapq.nlargest(max_tracks, releases, key=_BY_POPULARITY)
 
             logger.info(
                 f"Found {len(releases)} unique recent releases for '{artist_name}'"
             )
 
-            # Cache the fetched releases if database is available
+            # Cache the fetched releases if database is available. One transaction
+            # per artist, so an interrupted run can resume from complete entries.
             if self.db and releases:
                 logger.debug(f"Caching {len(releases)} releases for artist '{artist_name}'")
-                for release in releases:
-                    try:
-                        # Extract IDs from the release data
-                        # Note: We need to store artist_id, album_id, track_id which aren't in the final release dict
-                        # So we need to modify the release building code to include these IDs
-                        # For now, cache with what we have - we'll need to enhance this
-                        cache_data = {
+                try:
+                    self.db.cache_releases_batch([
+                        {
                             'artist_id': artist_id,
-                            'album_id': release.get('album_id', ''),  # We need to add this to releases
-                            'track_id': release.get('track_id', ''),  # We need to add this to releases
+                            'album_id': release.get('album_id', ''),
+                            'track_id': release.get('track_id', ''),
                             'isrc': release['isrc'] if release['isrc'] != 'N/A' else None,
                             'release_date': release['release_date'],
                             'album_name': release['album'],
@@ -799,13 +1485,18 @@ class SpotifyReleaseTracker:
                             'popularity': release['popularity'],
                             'spotify_url': release['spotify_url']
                         }
-                        self.db.cache_release(cache_data)
-                    except Exception as e:
-                        logger.warning(f"Failed to cache release '{release['track']}': {e}")
+                        for release in releases
+                    ])
+                except Exception as e:
+                    logger.warning(f"Failed to cache releases for '{artist_name}': {e}")
 
             # Store in memory cache for faster future access
             if releases:
                 self._memory_cache.put(cache_key, releases)
+            elif self.db and fetched_all:
+                # Remember the empty result so the next run can skip this artist;
+                # after a failed fetch "empty" may just mean "unknown"
+                self.db.mark_artists_empty([artist_id], self.cutoff_date_str)
 
             return releases
 
@@ -858,10 +1549,63 @@ class SpotifyReleaseTracker:
         releases = self._get_recent_releases(artist_id, artist_name, max_tracks)
         return artist_name, releases
 
+    @staticmethod
+    def _extract_artists(items: List[Dict]) -> Dict[str, str]:
+        """
+        Collect unique artists from playlist or library items in one pass.
+
+        Items without a track (removed or unavailable) and artists without an ID
+        (local files) are skipped.
+
+        Args:
+            items: Playlist or saved-track items, each with a 'track' object
+
+        Returns:
+            Dictionary mapping artist ID to artist name
+        """
+        return {
+            artist['id']: artist.get('name')
+            for item in items if item.get('track')
+            for artist in (item['track'].get('artists') or ())
+            if artist.get('id')
+        }
+
+    def _get_playlist_items(self, playlist_id: str) -> List[Dict]:
+        """
+        Fetch all items of a playlist, requesting pages after the first concurrently.
+
+        The first page reports total and limit, so the remaining offsets are known
+        up front. Only artist IDs and names are requested to keep responses small.
+
+        Args:
+            playlist_id: Spotify playlist ID
+
+        Returns:
+            Playlist items in playlist order
+        """
+        first_page = self._call_api('playlist_tracks', self.sp.playlist_tracks,
+                                    playlist_id, fields=self.PLAYLIST_ITEM_FIELDS)
+        items = first_page['items']
+
+        page_size = first_page.get('limit') or len(items)
+        offsets = range(page_size, first_page.get('total', 0), page_size) if page_size else []
+
+        if offsets:
+            def fetch_page(offset: int) -> Dict:
+                return self._call_api('playlist_tracks_page', self.sp.playlist_tracks,
+                                      playlist_id, fields=self.PLAYLIST_ITEM_FIELDS, offset=offset)
+
+            # executor.map yields results in offset order
+            for page in self._io_executor().map(fetch_page, offsets):
+                items.extend(page['items'])
+
+        return items
+
     def track_from_playlists(
         self,
         playlist_ids: List[str],
-        max_tracks_per_artist: Optional[int] = None
+        max_tracks_per_artist: Optional[int] = None,
+        on_releases: Optional[Callable[[List[Dict]], None]] = None
     ) -> Dict:
         """
         Track releases from one or more playlists.
@@ -869,6 +1613,7 @@ class SpotifyReleaseTracker:
         Args:
             playlist_ids: List of Spotify playlist IDs, URIs, or URLs
             max_tracks_per_artist: Optional cap on tracks per artist
+            on_releases: Optional callback receiving each artist's releases as soon as they are fetched
 
         Returns:
             Dictionary with results and statistics
@@ -877,54 +1622,41 @@ class SpotifyReleaseTracker:
 
         all_artists_dict = {} # artist_id -> artist_name
 
-        for playlist_id in playlist_ids:
+        def fetch_playlist_artists(playlist_id: str) -> Dict[str, str]:
             # Extract playlist ID from URL or URI if needed
-            clean_id = playlist_id
-            if 'spotify.com' in playlist_id:
-                match = re.search(r'playlist/([a-zA-Z0-9]+)', playlist_id)
-                if match:
-                    clean_id = match.group(1)
-            elif ':' in playlist_id:
-                clean_id = playlist_id.split(':')[-1]
+            match = self._PLAYLIST_URL_RE.search(playlist_id)
+            clean_id = match.group(1) if match else playlist_id.rsplit(':', 1)[-1]
 
             logger.info(f"Fetching artists from playlist {clean_id}...")
 
             try:
-                # Get playlist tracks
-                results = self.sp.playlist_tracks(clean_id)
-                tracks = results['items']
-
-                # Handle pagination
-                while results['next']:
-                    results = self.sp.next(results)
-                    tracks.extend(results['items'])
-
-                # Extract unique artists
-                for item in tracks:
-                    if item.get('track') and item['track'].get('artists'):
-                        for artist in item['track']['artists']:
-                            artist_id = artist.get('id')
-                            artist_name = artist.get('name')
-                            if artist_id:
-                                all_artists_dict[artist_id] = artist_name
-
+                return self._extract_artists(self._get_playlist_items(clean_id))
             except Exception as e:
                 logger.error(f"Error fetching playlist {clean_id}: {e}")
                 # Continue with other playlists
+                return {}
+
+        # Playlists are independent, so their pages are fetched concurrently;
+        # executor.map keeps the merge in playlist order
+        with ThreadPoolExecutor(max_workers=max(1, min(len(playlist_ids), self.max_workers))) as executor:
+            for playlist_artists in executor.map(fetch_playlist_artists, playlist_ids):
+                all_artists_dict.update(playlist_artists)
 
         logger.info(f"Found {len(all_artists_dict)} unique artists across all playlists")
 
-        return self._track_artists_common(all_artists_dict, max_tracks_per_artist)
+        return self._track_artists_common(all_artists_dict, max_tracks_per_artist, on_releases)
 
     def track_liked_songs(
         self,
-        max_tracks_per_artist: Optional[int] = None
+        max_tracks_per_artist: Optional[int] = None,
+        on_releases: Optional[Callable[[List[Dict]], None]] = None
     ) -> Dict:
         """
         Track releases from user's Liked Songs.
 
         Args:
             max_tracks_per_artist: Optional cap on tracks per artist
+            on_releases: Optional callback receiving each artist's releases as soon as they are fetched
 
         Returns:
             Dictionary with results and statistics
@@ -934,23 +1666,17 @@ class SpotifyReleaseTracker:
         all_artists_dict = {}
 
         try:
-            results = self.sp.current_user_saved_tracks(limit=50)
+            results = self._call_api('saved_tracks', self.sp.current_user_saved_tracks, limit=50)
             items = results['items']
 
             while results['next']:
-                results = self.sp.next(results)
+                results = self._call_api('saved_tracks_next', self.sp.next, results)
                 items.extend(results['items'])
 
-            for item in items:
-                if item.get('track') and item['track'].get('artists'):
-                    for artist in item['track']['artists']:
-                        artist_id = artist.get('id')
-                        artist_name = artist.get('name')
-                        if artist_id:
-                            all_artists_dict[artist_id] = artist_name
+            all_artists_dict.update(self._extract_artists(items))
 
             logger.info(f"Found {len(all_artists_dict)} unique artists in Liked Songs")
-            return self._track_artists_common(all_artists_dict, max_tracks_per_artist)
+            return self._track_artists_common(all_artists_dict, max_tracks_per_artist, on_releases)
 
         except SpotifyException as e:
             if e.http_status == 403 or e.http_status == 401:
@@ -989,7 +1715,7 @@ class SpotifyReleaseTracker:
                 }
 
             # Sort releases by date (newest first)
-            releases.sort(key=lambda x: x['release_date'], reverse=True)
+            releases.sort(key=_BY_RELEASE_DATE, reverse=True)
 
             return {
                 'releases': releases,
@@ -1007,9 +1733,13 @@ class SpotifyReleaseTracker:
                 'error': str(e)
             }
 
-    def _track_artists_common(self, artists_dict: Dict[str, str], max_tracks_per_artist: Optional[int] = None) -> Dict:
+    def _track_artists_common(self, artists_dict: Dict[str, str], max_tracks_per_artist: Optional[int] = None,
+                              on_releases: Optional[Callable[[List[Dict]], None]] = None) -> Dict:
         """
         Common logic to track releases for a dictionary of artists.
+
+        If on_releases is given, it is called from the calling thread with each
+        artist's releases in completion order, before the final sort.
         """
         if not artists_dict:
             return {
@@ -1019,34 +1749,63 @@ class SpotifyReleaseTracker:
                 'missing_artists': []
             }
 
-        all_releases = []
+        release_batches = []
         processed_count = 0
         missing_artists = []
 
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_artist = {
-                executor.submit(
-                    self._get_recent_releases, artist_id, artist_name, max_tracks_per_artist
-                ): (artist_id, artist_name)
-                for artist_id, artist_name in artists_dict.items()
-            }
+        # Skip artists that had nothing in this window on a recent run
+        artists_to_fetch = artists_dict
+        if self.db and not self.force_refresh:
+            empty_artists = self.db.get_empty_artists(self.cutoff_date_str)
+            missing_artists = [artist_id for artist_id in artists_dict if artist_id in empty_artists]
+            if missing_artists:
+                logger.info(f"Skipping {len(missing_artists)} artists with no recent releases last run")
+                artists_to_fetch = {
+                    artist_id: artist_name for artist_id, artist_name in artists_dict.items()
+                    if artist_id not in empty_artists
+                }
 
-            with tqdm(total=len(future_to_artist), desc="Tracking artists", unit="artist") as pbar:
-                for future in as_completed(future_to_artist):
-                    artist_id, artist_name = future_to_artist[future]
-                    try:
-                        releases = future.result()
-                        if releases:
-                            all_releases.extend(releases)
-                            processed_count += 1
-                        else:
-                            missing_artists.append(artist_id)
-                    except Exception as e:
-                        logger.error(f"Error processing artist '{artist_name}': {e}")
-                    pbar.update(1)
+        # Keep only a bounded number of futures in flight so memory stays
+        # proportional to the worker count, not the number of artists
+        pending_artists = iter(artists_to_fetch.items())
+        max_in_flight = self.max_workers * 2
 
-        # Sort releases by date (newest first)
-        all_releases.sort(key=lambda x: x['release_date'], reverse=True)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            def submit_next(count: int) -> None:
+                for artist_id, artist_name in itertools.islice(pending_artists, count):
+                    future = executor.submit(
+                        self._get_recent_releases, artist_id, artist_name, max_tracks_per_artist
+                    )
+                    future_to_artist[future] = (artist_id, artist_name)
+
+            future_to_artist = {}
+            submit_next(max_in_flight)
+
+            with tqdm(total=len(artists_to_fetch), desc="Tracking artists", unit="artist",
+                      disable=len(artists_to_fetch) < self.PROGRESS_BAR_MIN_ARTISTS) as pbar:
+                while future_to_artist:
+                    done, _ = wait(future_to_artist, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        artist_id, artist_name = future_to_artist.pop(future)
+                        try:
+                            releases = future.result()
+                            if releases:
+                                release_batches.append(releases)
+                                processed_count += 1
+                                if on_releases:
+                                    on_releases(releases)
+                            else:
+                                missing_artists.append(artist_id)
+                        except Exception as e:
+                            logger.error(f"Error processing artist '{artist_name}': {e}")
+                        pbar.update(1)
+
+                    submit_next(len(done))
+
+        # Flatten and sort by date (newest first) in a single allocation
+        all_releases = sorted(
+            itertools.chain.from_iterable(release_batches), key=_BY_RELEASE_DATE, reverse=True
+        )
 
         return {
             'releases': all_releases,
@@ -1057,15 +1816,25 @@ class SpotifyReleaseTracker:
         }
 
 
+# Per-release output templates, applied with % to each release dict
+_RELEASE_TSV_TEMPLATE = (
+    "%(release_date)s\t%(artist)s\t%(track)s\t"
+    "%(album)s\t%(album_type)s\t%(isrc)s\t%(spotify_url)s"
+)
+_RELEASE_PRETTY_TEMPLATE = (
+    "🎵 %(artist)s - %(track)s\n"
+    "   Album: %(album)s (%(album_type)s)\n"
+    "   Released: %(release_date)s\n"
+    "   URL: %(spotify_url)s\n"
+)
+
+# CSV fields containing any of these must be quoted
+_CSV_NEEDS_QUOTE = re.compile(r'[,"\r\n]')
+
+
 def format_releases_tsv(releases: List[Dict]) -> str:
     """Format releases as TSV."""
-    lines = []
-    for release in releases:
-        lines.append(
-            f"{release['release_date']}\t{release['artist']}\t{release['track']}\t"
-            f"{release['album']}\t{release['album_type']}\t{release['isrc']}\t{release['spotify_url']}"
-        )
-    return '\n'.join(lines)
+    return '\n'.join(_RELEASE_TSV_TEMPLATE % release for release in releases)
 
 
 
@@ -1074,37 +1843,50 @@ def format_releases_ids(releases: List[Dict]) -> str:
     return '\n'.join([f"spotify:track:{r['track_id']}" for r in releases])
 
 
-def format_releases_csv(releases: List[Dict]) -> str:
-    """Format releases as CSV."""
-    import csv
-    from io import StringIO
+def _csv_field(value) -> str:
+    """Render one CSV field, quoting it only when needed (as csv.QUOTE_MINIMAL does)."""
+    text = '' if value is None else str(value)
+    if _CSV_NEEDS_QUOTE.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
 
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['date', 'artist', 'track', 'album', 'type', 'isrc', 'url', 'popularity'])
 
-    for release in releases:
-        writer.writerow([
-            release['release_date'],
-            release['artist'],
-            release['track'],
-            release['album'],
-            release['album_type'],
-            release['isrc'],
-            release['spotify_url'],
-            release.get('popularity', '')
-        ])
+_CSV_HEADER = 'date,artist,track,album,type,isrc,url,popularity'
 
-    return output.getvalue().rstrip()
+
+def _csv_row(release: Dict) -> str:
+    """Render one release as a CSV row (without line terminator)."""
+    return ','.join(map(_csv_field, (
+        release['release_date'],
+        release['artist'],
+        release['track'],
+        release['album'],
+        release['album_type'],
+        release['isrc'],
+        release['spotify_url'],
+        release.get('popularity', '')
+    )))
+
+
+def format_releases_csv(releases: List[Dict]) -> str:
+    """Format releases as CSV."""
+    lines = [_CSV_HEADER]
+    lines.extend(map(_csv_row, releases))
+
+    # csv.writer terminates rows with \r\n; keep that so output is unchanged
+    return '\r\n'.join(lines)
 
 
 def format_releases_json(releases: List[Dict], meta: Dict) -> str:
     """Format releases as JSON."""
-    import json
     output = {
         'releases': releases,
         'meta': meta
     }
+    if orjson is not None:
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+    import json
     return json.dumps(output, indent=2, ensure_ascii=False)
 
 
@@ -1120,12 +1902,7 @@ def format_releases_pretty(releases: List[Dict], tracker: SpotifyReleaseTracker)
     lines.append("")
 
     if releases:
-        for release in releases:
-            lines.append(f"🎵 {release['artist']} - {release['track']}")
-            lines.append(f"   Album: {release['album']} ({release['album_type']})")
-            lines.append(f"   Released: {release['release_date']}")
-            lines.append(f"   URL: {release['spotify_url']}")
-            lines.append("")
+        lines.extend(_RELEASE_PRETTY_TEMPLATE % release for release in releases)
     else:
         lines.append("No recent releases found.")
         lines.append("")
@@ -1138,6 +1915,26 @@ def cmd_track(args, tracker: SpotifyReleaseTracker):
     
     results = {}
 
+    # Determine output format
+    output_format = getattr(args, 'format', 'tsv')
+
+    # Streaming prints rows as each artist finishes, so it needs a row-oriented
+    # format and no filter that looks at the full result set
+    on_releases = None
+    stream = (getattr(args, 'stream', False) and output_format in ('tsv', 'csv')
+              and not getattr(args, 'delta_only', False) and not args.artist)
+    if stream:
+        if output_format == 'csv':
+            sys.stdout.write(_CSV_HEADER + '\r\n')
+
+            def on_releases(releases: List[Dict]) -> None:
+                sys.stdout.write(''.join(_csv_row(release) + '\r\n' for release in releases))
+                sys.stdout.flush()
+        else:
+            def on_releases(releases: List[Dict]) -> None:
+                sys.stdout.write(format_releases_tsv(releases) + '\n')
+                sys.stdout.flush()
+
     if args.liked:
         # Check for redirect URI (required for OAuth)
         if not os.getenv('SPOTIPY_REDIRECT_URI'):
@@ -1145,13 +1942,13 @@ def cmd_track(args, tracker: SpotifyReleaseTracker):
              # But let's try anyway, maybe the user has a cached token
              pass
 
-        results = tracker.track_liked_songs(args.max_per_artist)
+        results = tracker.track_liked_songs(args.max_per_artist, on_releases)
 
     elif args.artist:
         results = tracker.track_artist(args.artist, args.max_per_artist)
 
     elif args.playlists:
-        results = tracker.track_from_playlists(args.playlists, args.max_per_artist)
+        results = tracker.track_from_playlists(args.playlists, args.max_per_artist, on_releases)
 
     else:
         # Should not happen due to argparse requirements, but safe guard
@@ -1174,8 +1971,7 @@ def cmd_track(args, tracker: SpotifyReleaseTracker):
                 # Check if this release was added since last run
                 artist_id = release.get('artist_id', '')
                 if artist_id:
-                    cutoff_date_str = tracker.cutoff_date.strftime('%Y-%m-%d')
-                    new_releases = tracker.db.get_new_releases_since_last_run(artist_id, cutoff_date_str)
+                    new_releases = tracker.db.get_new_releases_since_last_run(artist_id, tracker.cutoff_date_str)
                     # Check if this release is in the new releases list
                     if any(r['track_id'] == release.get('track_id') for r in new_releases):
                         delta_releases.append(release)
@@ -1190,33 +1986,33 @@ def cmd_track(args, tracker: SpotifyReleaseTracker):
 
     # Show activity profiles if requested
     if getattr(args, 'show_activity', False) and tracker.db:
-        print("\n📊 Artist Activity Profiles:")
-        print("=" * 80)
-
-        # Get unique artist IDs from results
-        artist_ids = set()
+        # Map artist IDs to names from the results in one pass
+        artist_names = {}
         for release in results['releases']:
             if release.get('artist_id'):
-                artist_ids.add(release.get('artist_id'))
+                artist_names.setdefault(release['artist_id'], release.get('artist', 'Unknown'))
 
-        for artist_id in sorted(artist_ids):
+        lines = ["\n📊 Artist Activity Profiles:", "=" * 80]
+        for artist_id in sorted(artist_names):
             profile = tracker.db.get_artist_activity_profile(artist_id)
-            artist_name = next((r['artist'] for r in results['releases'] if r.get('artist_id') == artist_id), 'Unknown')
-
-            print(f"\n{artist_name}:")
-            print(f"  Frequency: {profile['release_frequency']}")
-            print(f"  Last release: {profile['last_release_days_ago']} days ago")
-            print(f"  Avg releases/year: {profile['avg_releases_per_year']}")
-            print(f"  Recommended check interval: {profile['recommended_check_interval_days']} days")
-            print(f"  Total releases tracked: {profile['total_releases']}")
-
-        print("=" * 80)
+            lines.append(
+                f"\n{artist_names[artist_id]}:\n"
+                f"  Frequency: {profile['release_frequency']}\n"
+                f"  Last release: {profile['last_release_days_ago']} days ago\n"
+                f"  Avg releases/year: {profile['avg_releases_per_year']}\n"
+                f"  Recommended check interval: {profile['recommended_check_interval_days']} days\n"
+                f"  Total releases tracked: {profile['total_releases']}"
+            )
+        lines.append("=" * 80)
 
-    # Determine output format
-    output_format = getattr(args, 'format', 'tsv')
+        # One write instead of six print() calls per artist
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Print results based on format
-    if output_format == 'pretty':
+    if stream:
+        pass  # Rows were already written as they arrived
+
+    elif output_format == 'pretty':
         output = format_releases_pretty(results['releases'], tracker)
         print("\n" + output)
 
@@ -1264,132 +2060,18 @@ def cmd_track(args, tracker: SpotifyReleaseTracker):
         )
 
 
-def main():
-
-    """Main entry point with CLI commands."""
-    # Load environment variables
-    load_dotenv()
-
-    # Set up argument parser
-    parser = argparse.ArgumentParser(
-        description='Spotify Recent Release Tracker - Track new releases from playlists, artists, or your library',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Track from a playlist
-  python main.py track 37i9dQZF1DXcBWIGoYBM5M
-
-  # Track from multiple playlists
-  python main.py track 37i9dQZF1DXcBWIGoYBM5M 4j3i...
-
-  # Track from your "Liked Songs"
-  python main.py track --liked
-
-  # Track a single artist (demo)
-  python main.py track --artist="Megadeth"
-
-  # With options
-  python main.py track 37i9dQZF1DXcBWIGoYBM5M --days 30 --format pretty
-        """
-    )
-
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # track command
-    parser_track = subparsers.add_parser(
-        'track',
-        help='Track recent releases'
-    )
-
-    # Arguments for track
-    parser_track.add_argument(
-        'playlists',
-        nargs='*',
-        help='Spotify playlist IDs, URIs, or URLs'
-    )
-
-    group = parser_track.add_mutually_exclusive_group()
-    group.add_argument(
-        '--liked',
-        action='store_true',
-        help='Track from your "Liked Songs" library'
-    )
-    group.add_argument(
-        '--artist',
-        help='Track a single artist by name or ID'
-    )
-
-    parser_track.add_argument(
-        '--format', '-f',
-        choices=['tsv', 'json', 'csv', 'pretty', 'ids'],
-        default='pretty', # Changed default to pretty for better UX as per user request
-        help='Output format: pretty (default), tsv, json, or csv'
-    )
-    parser_track.add_argument(
-        '--days', '-d',
-        type=int,
-        default=None,
-        help='Days to look back (default: 90)'
-    )
-    parser_track.add_argument(
-        '--since',
-        type=str,
-        default=None,
-        help='Start date in YYYY-MM-DD format (overrides --days)'
-    )
-    parser_track.add_argument(
-        '--max-per-artist', '-m',
-        type=int,
-        default=None,
-        help='Cap number of tracks per artist (uses popularity ranking)'
-    )
-    parser_track.add_argument(
-        '--profile',
-        action='store_true',
-        help='Enable performance profiling and show statistics'
-    )
-    parser_track.add_argument(
-        '--force-refresh',
-        action='store_true',
-        help='Bypass cache and fetch fresh data from API'
-    )
-    parser_track.add_argument(
-        '--verbose', '-v',
-        action='store_true',
-        help='Enable verbose logging to console'
-    )
-    parser_track.add_argument(
-        '--incremental',
-        action='store_true',
-        help='Incremental mode: only fetch releases since last run (optimized for weekly schedules)'
-    )
-    parser_track.add_argument(
-        '--delta-only',
-        action='store_true',
-        help='Delta-only: show only releases added since last run (requires database)'
-    )
-    parser_track.add_argument(
-        '--show-activity',
-        action='store_true',
-        help='Show artist activity profiles (release frequency and recommendations)'
-    )
-
-    args = parser.parse_args()
-
-    # Default to 'track' command and show help if no args provided
-    if not args.command:
-        parser.print_help()
-        sys.exit(0)
-
-    # For 'track' command, check if any source is provided
-    if args.command == 'track':
-        if not args.playlists and not args.liked and not args.artist:
-             # If no args provided to track, print help for track
-             parser_track.print_help()
-             sys.exit(0)
+def run(args: argparse.Namespace) -> None:
+    """
+    Run a parsed CLI command.
 
+    Args:
+        args: Arguments from artist_tracker.cli.parse_args
+    """
     # Setup logging
-    setup_logging(getattr(args, 'verbose', False))
+    setup_logging(args.verbose)
+
+    # Load environment variables only once a command will talk to Spotify
+    load_dotenv()
 
     # Check credentials
     client_id = os.getenv('SPOTIPY_CLIENT_ID')
@@ -1415,17 +2097,32 @@ Examples:
     elif args.days:
         lookback_days = args.days
 
+    # Concurrency: --workers wins over the MAX_WORKERS environment variable
+    max_workers = args.workers
+    workers_source = '--workers'
+    if max_workers is None and os.getenv('MAX_WORKERS'):
+        workers_source = 'MAX_WORKERS'
+        try:
+            max_workers = int(os.getenv('MAX_WORKERS'))
+        except ValueError:
+            logger.error(f"Invalid value for MAX_WORKERS: {os.getenv('MAX_WORKERS')}. Must be an integer.")
+            sys.exit(1)
+
+    if max_workers is not None and max_workers < 1:
+        logger.error(f"Invalid value for {workers_source}: {max_workers}. Must be at least 1.")
+        sys.exit(1)
+
     # Initialize database for caching
     db = ArtistDatabase('artists.db')
 
     # Create profiler if --profile flag is set
     profiler = None
-    if getattr(args, 'profile', False):
+    if args.profile:
         profiler = PerformanceStats()
 
     # Determine Auth Manager
     auth_manager = None
-    if getattr(args, 'liked', False):
+    if args.liked:
         # Use OAuth for Liked Songs
         # Default scope for reading user library
         scope = "user-library-read"
@@ -1440,10 +2137,12 @@ Examples:
             open_browser=False
         )
     else:
-        # Use Client Credentials for everything else
+        # Use Client Credentials for everything else. Its token gets its own
+        # cache file per client ID so it can't clash with SpotifyOAuth's .cache.
         auth_manager = SpotifyClientCredentials(
             client_id=client_id,
-            client_secret=client_secret
+            client_secret=client_secret,
+            cache_handler=CacheFileHandler(cache_path=f'.cache-client-{client_id}')
         )
 
     # Initialize tracker
@@ -1451,16 +2150,22 @@ Examples:
         lookback_days=lookback_days,
         profiler=profiler,
         db=db,
-        force_refresh=getattr(args, 'force_refresh', False),
+        force_refresh=args.force_refresh,
         auth_manager=auth_manager,
-        incremental=getattr(args, 'incremental', False)
+        incremental=args.incremental,
+        max_workers=max_workers
     )
 
     # Execute command
-    if args.command == 'track':
+    try:
         cmd_track(args, tracker)
-    else:
-        parser.print_help()
+    finally:
+        tracker.close()
+
+
+def main():
+    """Main entry point with CLI commands."""
+    run(parse_args())
 
 
 if __name__ == '__main__':
@@ -5,11 +5,14 @@ Unit tests for ArtistDatabase.
 Comprehensive test suite for database operations.
 """
 
+import json
 import os
 import sqlite3
 import unittest
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from unittest.mock import patch
 
 from artist_tracker.database import ArtistDatabase
 from artist_tracker.exceptions import DatabaseError, ValidationError
@@ -37,7 +40,7 @@ class TestArtistDatabase(unittest.TestCase):
 
     def test_init_creates_schema(self):
         """Test that schema is created correctly."""
-        with sqlite3.connect(self.test_db) as conn:
+        with closing(sqlite3.connect(self.test_db)) as conn, conn:
             cursor = conn.cursor()
 
             # Check table exists
@@ -55,6 +58,11 @@ class TestArtistDatabase(unittest.TestCase):
             self.assertEqual(columns['artist_name'], 'TEXT')
             self.assertEqual(columns['spotify_artist_id'], 'TEXT')
 
+    def test_init_enables_wal(self):
+        """Test that the database is switched to write-ahead logging."""
+        with closing(sqlite3.connect(self.test_db)) as conn:
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+
     def test_add_artist_success(self):
         """Test adding a new artist."""
         result = self.db.add_artist("Taylor Swift", "06HL4z0CvFAxyc27GXpf02")
@@ -338,6 +346,11 @@ class TestArtistDatabaseEdgeCases(unittest.TestCase):
         if os.path.exists(self.test_db):
             os.remove(self.test_db)
 
+    def test_init_unopenable_path_raises(self):
+        """Test that a database that cannot be opened fails at startup."""
+        with self.assertRaises(DatabaseError):
+            ArtistDatabase(os.path.join('no_such_directory', 'artists.db'))
+
     def test_empty_batch_add(self):
         """Test adding empty batch of artists."""
         added, skipped = self.db.add_artists_batch([])
@@ -378,5 +391,319 @@ class TestArtistDatabaseEdgeCases(unittest.TestCase):
         self.assertEqual(artists[0][2], malicious_input)
 
 
+class TestISRCLookupCache(unittest.TestCase):
+    """Test the persistent ISRC lookup cache."""
+
+    def setUp(self):
+        """Set up test database before each test."""
+        self.test_db = 'test_isrc_cache.db'
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.db = ArtistDatabase(self.test_db)
+
+    def tearDown(self):
+        """Clean up test database after each test."""
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_cache_and_get_isrc_lookup(self):
+        """Test round-tripping a single ISRC lookup."""
+        self.assertTrue(self.db.cache_isrc_lookup('GBUM71029604', '1986-03-03', 'Master of Puppets'))
+        self.assertEqual(self.db.get_cached_isrc_lookup('GBUM71029604'),
+                         ('1986-03-03', 'Master of Puppets'))
+
+    def test_get_isrc_lookup_miss(self):
+        """Test that an unknown ISRC returns None."""
+        self.assertIsNone(self.db.get_cached_isrc_lookup('UNKNOWN00000'))
+
+    def test_cache_isrc_lookups_batch(self):
+        """Test caching several ISRC lookups in one call."""
+        written = self.db.cache_isrc_lookups_batch([
+            ('GBUM71029604', '1986-03-03', 'Master of Puppets'),
+            ('FR0W60600010', '2005-09-12', 'From Mars to Sirius'),
+        ])
+        self.assertEqual(written, 2)
+        self.assertEqual(self.db.get_cached_isrc_lookup('FR0W60600010'),
+                         ('2005-09-12', 'From Mars to Sirius'))
+
+    def test_known_isrcs_loaded_on_startup(self):
+        """Test that ISRCs cached by a previous instance are found by a new one."""
+        self.db.cache_isrc_lookup('SEBGA0500101', '2005-04-25', 'Ghost Reveries')
+
+        db2 = ArtistDatabase(self.test_db)
+        self.assertEqual(db2.get_cached_isrc_lookup('SEBGA0500101'),
+                         ('2005-04-25', 'Ghost Reveries'))
+
+    def test_cache_isrc_lookups_batch_empty(self):
+        """Test that an empty batch is a no-op."""
+        self.assertEqual(self.db.cache_isrc_lookups_batch([]), 0)
+
+
+class TestArtistLookupCache(unittest.TestCase):
+    """Test the persistent artist lookup cache."""
+
+    def setUp(self):
+        """Set up test database before each test."""
+        self.test_db = 'test_artist_lookup_cache.db'
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.db = ArtistDatabase(self.test_db)
+
+    def tearDown(self):
+        """Clean up test database after each test."""
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_cache_and_get_artist_lookup(self):
+        """Test round-tripping an artist lookup."""
+        self.assertTrue(self.db.cache_artist_lookup('search:mastodon', '1Dvfqq39HxvCJ3GvfeIFuT'))
+        self.assertEqual(self.db.get_cached_artist_lookup('search:mastodon'), '1Dvfqq39HxvCJ3GvfeIFuT')
+
+    def test_get_artist_lookup_miss(self):
+        """Test that unknown keys return None."""
+        self.assertIsNone(self.db.get_cached_artist_lookup('artist:unknown'))
+
+    def test_cache_and_get_http_response(self):
+        """Test response body and ETag round-trip through compressed storage."""
+        url = 'https://api.spotify.com/v1/artists/1Dvfqq39HxvCJ3GvfeIFuT/albums?limit=50'
+        body = b'{"items": [{"name": "Leviathan"}]}'
+
+        self.assertTrue(self.db.cache_http_response(url, '"abc123"', body))
+        etag, cached_body, age = self.db.get_http_response(url)
+        self.assertEqual((etag, cached_body), ('"abc123"', body))
+        self.assertLess(age, 60)
+        self.assertIsNone(self.db.get_http_response(url + '&offset=50'))
+
+    def test_touch_http_response(self):
+        """Test that touching a response resets its age."""
+        url = 'https://api.spotify.com/v1/albums/?ids=6KMMvzyxkQDmOHFxi8YDeB'
+        self.db.cache_http_response(url, '', b'{"albums": []}')
+
+        with closing(sqlite3.connect(self.db.db_path)) as conn, conn:
+            conn.execute("UPDATE http_response_cache SET cached_at = '2000-01-01T00:00:00'")
+
+        self.assertGreater(self.db.get_http_response(url)[2], 3600)
+        self.assertTrue(self.db.touch_http_response(url))
+        self.assertLess(self.db.get_http_response(url)[2], 60)
+        self.assertFalse(self.db.touch_http_response(url + ',other'))
+
+    def test_clear_expired_http_responses(self):
+        """Test that only responses older than the limit are deleted."""
+        old_url = 'https://api.spotify.com/v1/albums/?ids=6KMMvzyxkQDmOHFxi8YDeB'
+        new_url = 'https://api.spotify.com/v1/albums/?ids=2Ys4mkuN3ayJVIGDv1ZlBb'
+        self.db.cache_http_response(old_url, '', b'{"albums": []}')
+
+        with closing(sqlite3.connect(self.db.db_path)) as conn, conn:
+            conn.execute("UPDATE http_response_cache SET cached_at = '2000-01-01T00:00:00'")
+        self.db.cache_http_response(new_url, '', b'{"albums": []}')
+
+        self.assertEqual(self.db.clear_expired_http_responses(3600), 1)
+        self.assertIsNone(self.db.get_http_response(old_url))
+        self.assertIsNotNone(self.db.get_http_response(new_url))
+
+    def test_stale_artist_lookup_ignored(self):
+        """Test that entries older than max_age_hours are not returned."""
+        self.db.cache_artist_lookup('artist:1Dvfqq39HxvCJ3GvfeIFuT', 'Mastodon')
+
+        with closing(sqlite3.connect(self.test_db)) as conn, conn:
+            conn.execute("UPDATE artist_lookup_cache SET cached_at = '2000-01-01T00:00:00'")
+
+        self.assertIsNone(self.db.get_cached_artist_lookup('artist:1Dvfqq39HxvCJ3GvfeIFuT'))
+        self.assertEqual(
+            self.db.get_cached_artist_lookup('artist:1Dvfqq39HxvCJ3GvfeIFuT', max_age_hours=None),
+            'Mastodon'
+        )
+
+
+class TestEmptyArtistCache(unittest.TestCase):
+    """Test the cache of artists with no recent releases."""
+
+    def setUp(self):
+        """Set up test database before each test."""
+        self.test_db = 'test_empty_artist_cache.db'
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.db = ArtistDatabase(self.test_db)
+
+    def tearDown(self):
+        """Clean up test database after each test."""
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def test_mark_and_get_empty_artists(self):
+        """Test round-tripping empty artists for the same cutoff."""
+        self.assertEqual(self.db.mark_artists_empty(['bathory_id', 'emperor_id'], '2024-03-03'), 2)
+        self.assertEqual(self.db.get_empty_artists('2024-03-03'), {'bathory_id', 'emperor_id'})
+
+    def test_wider_window_rechecks_artists(self):
+        """Test an earlier cutoff (wider window) is not covered by the cached check."""
+        self.db.mark_artists_empty(['bathory_id'], '2024-03-03')
+        self.assertEqual(self.db.get_empty_artists('2023-06-01'), set())
+        self.assertEqual(self.db.get_empty_artists('2024-03-10'), {'bathory_id'})
+
+    def test_stale_empty_artists_ignored(self):
+        """Test entries older than max_age_hours are not returned."""
+        self.db.mark_artists_empty(['bathory_id'], '2024-03-03')
+
+        with closing(sqlite3.connect(self.test_db)) as conn, conn:
+            conn.execute("UPDATE empty_artist_cache SET checked_at = '2000-01-01T00:00:00'")
+
+        self.assertEqual(self.db.get_empty_artists('2024-03-03'), set())
+
+
+class TestReleaseCacheBatch(unittest.TestCase):
+    """Test writing an artist's releases to the cache in one transaction."""
+
+    def setUp(self):
+        """Set up test database before each test."""
+        self.test_db = 'test_release_cache_batch.db'
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+        self.db = ArtistDatabase(self.test_db)
+
+    def tearDown(self):
+        """Clean up test database after each test."""
+        if os.path.exists(self.test_db):
+            os.remove(self.test_db)
+
+    def _release(self, track_id, release_date):
+        return {
+            'artist_id': 'deftones_id',
+            'album_id': 'private_music',
+            'track_id': track_id,
+            'isrc': f'ISRC{track_id}',
+            'release_date': release_date,
+            'album_name': 'Private Music',
+            'track_name': f'Track {track_id}',
+            'album_type': 'album',
+            'popularity': 60,
+            'spotify_url': f'https://open.spotify.com/track/{track_id}'
+        }
+
+    def test_cache_releases_batch_round_trip(self):
+        """Test batched releases are served back newest first."""
+        cached = self.db.cache_releases_batch([
+            self._release('t1', '2025-08-22'),
+            self._release('t2', '2025-09-01')
+        ])
+
+        self.assertEqual(cached, 2)
+        releases = self.db.get_cached_releases('deftones_id', '2025-01-01', max_age_hours=1)
+        self.assertEqual([r['track_id'] for r in releases], ['t2', 't1'])
+
+    def test_activity_profile_counts_tracks_sharing_a_date(self):
+        """Test every cached track counts even when release dates repeat."""
+        self.db.cache_releases_batch(
+            [self._release(f't{n}', '2020-11-13') for n in range(3)]
+            + [self._release('t9', '2019-01-01')]
+        )
+
+        profile = self.db.get_artist_activity_profile('deftones_id')
+
+        self.assertEqual(profile['total_releases'], 4)
+        self.assertGreater(profile['last_release_days_ago'], 0)
+
+    def test_cache_releases_batch_empty(self):
+        """Test an empty batch writes nothing."""
+        self.assertEqual(self.db.cache_releases_batch([]), 0)
+
+    def test_cache_releases_batch_is_atomic(self):
+        """Test a failing row rolls back the whole batch."""
+        bad = self._release('t2', None)  # release_date is NOT NULL
+
+        with self.assertRaises(DatabaseError):
+            self.db.cache_releases_batch([self._release('t1', '2025-08-22'), bad])
+
+        self.assertEqual(self.db.get_cached_releases('deftones_id', '2000-01-01', max_age_hours=1), [])
+
+
+class TestJSONBackup(unittest.TestCase):
+    """Test JSON export and import of the artist list."""
+
+    def setUp(self):
+        """Set up test database before each test."""
+        self.test_db = 'test_json_backup.db'
+        self.paths = [self.test_db, 'test_backup.json', 'test_backup.ndjson']
+        self.tearDown()
+        self.db = ArtistDatabase(self.test_db)
+        self.db.add_artists_batch([
+            ('Opeth', '0ybFZ2Ab08V8hueghSXm6E'),
+            ('Mastodon', '1Dvfqq39HxvCJ3GvfeIFuT')
+        ])
+
+    def tearDown(self):
+        """Clean up test files after each test."""
+        for path in self.paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_export_to_json_array(self):
+        """Test export writes a JSON array readable by json.load."""
+        self.assertEqual(self.db.export_to_json('test_backup.json'), 2)
+
+        with open('test_backup.json', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual({a['artist_name'] for a in data}, {'Opeth', 'Mastodon'})
+
+    def test_export_to_ndjson(self):
+        """Test .ndjson export writes one object per line."""
+        self.assertEqual(self.db.export_to_json('test_backup.ndjson'), 2)
+
+        with open('test_backup.ndjson', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual({json.loads(line)['artist_name'] for line in lines}, {'Opeth', 'Mastodon'})
+
+    def test_round_trip_without_orjson(self):
+        """Test the stdlib fallback keeps non-ASCII names intact."""
+        self.db.add_artist('Mötley Crüe', '0cc6vw3VN8YlF5dnZTwsIH')
+
+        with patch('artist_tracker.database.orjson', None):
+            self.db.export_to_json('test_backup.ndjson')
+            self.db.clear_all_artists()
+            added, _ = self.db.import_from_json('test_backup.ndjson')
+
+        self.assertEqual(added, 3)
+        self.assertEqual(self.db.get_artist_by_id('0cc6vw3VN8YlF5dnZTwsIH')[2], 'Mötley Crüe')
+
+    def test_export_import_round_trip(self):
+        """Test a backup restores into an empty database."""
+        self.db.export_to_json('test_backup.json')
+        self.db.clear_all_artists()
+
+        self.assertEqual(self.db.import_from_json('test_backup.json'), (2, 0))
+        self.assertEqual(self.db.get_artist_count(), 2)
+
+    def test_import_ndjson_in_batches(self):
+        """Test NDJSON import skips bad lines and inserts in batches."""
+        with open('test_backup.ndjson', 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'artist_name': 'Opeth', 'spotify_artist_id': '0ybFZ2Ab08V8hueghSXm6E'}) + '\n')
+            f.write('\n')
+            f.write(json.dumps({'artist_name': 'Gojira'}) + '\n')
+            f.write(json.dumps({'artist_name': 'Gojira', 'spotify_artist_id': '0GDGKpJFhVpcjIGF8N6Ewt'}) + '\n')
+
+        self.db.IMPORT_BATCH_SIZE = 1
+        added, skipped = self.db.import_from_json('test_backup.ndjson')
+
+        self.assertEqual((added, skipped), (1, 1))
+        self.assertIsNotNone(self.db.get_artist_by_id('0GDGKpJFhVpcjIGF8N6Ewt'))
+
+    def test_import_rejects_non_array(self):
+        """Test a JSON object at top level is rejected."""
+        with open('test_backup.json', 'w', encoding='utf-8') as f:
+            json.dump({'artist_name': 'Opeth'}, f)
+
+        with self.assertRaises(DatabaseError):
+            self.db.import_from_json('test_backup.json')
+
+    def test_export_empty_database(self):
+        """Test exporting no artists still produces a valid JSON array."""
+        self.db.clear_all_artists()
+        self.assertEqual(self.db.export_to_json('test_backup.json'), 0)
+
+        with open('test_backup.json', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,10 +5,34 @@ Unit tests for Spotify Release Tracker.
 All tests use mocked Spotify API - no network calls are made.
 """
 
+import csv
+import json
+import logging
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from io import StringIO
 from unittest.mock import Mock, patch, mock_open
-from artist_tracker.tracker import SpotifyReleaseTracker
+import requests
+from spotipy.exceptions import SpotifyException
+from tqdm import tqdm
+from artist_tracker import tracker as tracker_module
+from artist_tracker.cli import parse_args
+from artist_tracker.tracker import (
+    LRUCache,
+    SharedTokenAuthManager,
+    SpotifyReleaseTracker,
+    ConditionalRequestSession,
+    TokenBucket,
+    create_optimized_session,
+    format_releases_csv,
+    format_releases_ids,
+    format_releases_json,
+    format_releases_pretty,
+    format_releases_tsv,
+    setup_logging
+)
 from artist_tracker.exceptions import SpotifyAPIError
 
 
@@ -75,6 +99,38 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
         date = self.tracker._parse_release_date('invalid-date')
         self.assertIsNone(date)
 
+    def test_parse_release_date_memoized(self):
+        """Test repeated dates are parsed once and partial dates share the cache entry."""
+        first = self.tracker._parse_release_date('2016-09-30')
+        self.assertIs(self.tracker._parse_release_date('2016-09-30'), first)
+        self.assertIs(self.tracker._parse_release_date('1994'),
+                      self.tracker._parse_release_date('1994-01-01'))
+
+    def test_normalize_release_date(self):
+        """Test partial dates are padded so they compare as strings."""
+        self.assertEqual(self.tracker._normalize_release_date('2024'), '2024-01-01')
+        self.assertEqual(self.tracker._normalize_release_date('2024-03'), '2024-03-01')
+        self.assertEqual(self.tracker._normalize_release_date('2024-03-15'), '2024-03-15')
+
+    def test_old_albums_skipped_without_parsing(self):
+        """Test albums before the cutoff are rejected by string comparison alone."""
+        self.tracker.cutoff_date = datetime(2024, 3, 3)
+        self.tracker.sp.artist_albums.return_value = {
+            'items': [
+                {'id': 'old', 'name': 'Reign in Blood', 'release_date': '1986-10-07',
+                 'album_type': 'album'},
+                {'id': 'older', 'name': 'Show No Mercy', 'release_date': '1983',
+                 'album_type': 'album'}
+            ],
+            'next': None
+        }
+
+        with patch.object(self.tracker, '_parse_release_date') as mock_parse:
+            releases = self.tracker._get_recent_releases('artist123', 'Slayer')
+
+        self.assertEqual(releases, [])
+        mock_parse.assert_not_called()
+
     @patch('artist_tracker.tracker.datetime')
     def test_lookback_window_boundary_keep(self, mock_datetime):
         """Test that releases exactly 90 days ago are kept."""
@@ -139,6 +195,13 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
         self.assertTrue(self.tracker._is_noise('Song (Live Remastered)'))
         self.assertTrue(self.tracker._is_noise('Demo - Instrumental'))
 
+    def test_is_noise_whole_words_only(self):
+        """Test keywords embedded in other words are not noise."""
+        self.assertFalse(self.tracker._is_noise('Special Delivery'))
+        self.assertFalse(self.tracker._is_noise('Alive'))
+        self.assertFalse(self.tracker._is_noise('Demon Hunter'))
+        self.assertTrue(self.tracker._is_noise('The Demos'))
+
     def test_search_artist_success(self):
         """Test successful artist search."""
         # Mock successful search
@@ -228,7 +291,9 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
                     ]
                 }
 
-        tracker.sp.album_tracks.side_effect = mock_album_tracks
+        tracker.sp.albums.side_effect = lambda ids: {
+            'albums': [{'id': i, 'tracks': mock_album_tracks(i)} for i in ids]
+        }
 
         # Mock track details with same ISRC
         def mock_track(track_id):
@@ -240,7 +305,7 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
                 'artists': [{'id': 'artist123', 'name': 'Test Artist'}]
             }
 
-        tracker.sp.track.side_effect = mock_track
+        tracker.sp.tracks.side_effect = lambda ids: {'tracks': [mock_track(i) for i in ids]}
 
         # Get releases
         releases = tracker._get_recent_releases('artist123', 'Test Artist')
@@ -294,7 +359,9 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
                 ]
             }
 
-        tracker.sp.album_tracks.side_effect = mock_album_tracks
+        tracker.sp.albums.side_effect = lambda ids: {
+            'albums': [{'id': i, 'tracks': mock_album_tracks(i)} for i in ids]
+        }
 
         # Mock track details
         def mock_track(track_id):
@@ -306,7 +373,7 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
                 'artists': [{'id': 'artist123', 'name': 'Test Artist'}]
             }
 
-        tracker.sp.track.side_effect = mock_track
+        tracker.sp.tracks.side_effect = lambda ids: {'tracks': [mock_track(i) for i in ids]}
 
         # Get releases
         releases = tracker._get_recent_releases('artist123', 'Test Artist')
@@ -330,7 +397,8 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
                     }
                 }
             ],
-            'next': None
+            'total': 1,
+            'limit': 100
         }
 
         # Mock _track_artists_common to avoid threading logic in this unit test
@@ -339,36 +407,57 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
 
             self.tracker.track_from_playlists(['playlist123'])
 
-            self.tracker.sp.playlist_tracks.assert_called_once_with('playlist123')
+            self.tracker.sp.playlist_tracks.assert_called_once_with(
+                'playlist123', fields=SpotifyReleaseTracker.PLAYLIST_ITEM_FIELDS
+            )
             mock_common.assert_called_once()
             args, _ = mock_common.call_args
             self.assertEqual(len(args[0]), 2) # 2 artists
 
+    def test_track_from_playlists_accepts_urls_and_uris(self):
+        """Test playlist URLs, URIs and bare IDs resolve to the same ID."""
+        self.tracker.sp.playlist_tracks.return_value = {'items': [], 'total': 0, 'limit': 100}
+
+        with patch.object(self.tracker, '_track_artists_common', return_value={}):
+            self.tracker.track_from_playlists([
+                'https://open.spotify.com/playlist/37i9dQZF1DWWOaP4H0w5b0?si=abc',
+                'spotify:playlist:37i9dQZF1DWWOaP4H0w5b0',
+                '37i9dQZF1DWWOaP4H0w5b0'
+            ])
+
+        requested = [c[0][0] for c in self.tracker.sp.playlist_tracks.call_args_list]
+        self.assertEqual(requested, ['37i9dQZF1DWWOaP4H0w5b0'] * 3)
+
+    def test_extract_artists_skips_local_and_missing_tracks(self):
+        """Test artist extraction ignores removed tracks and local files."""
+        items = [
+            {'track': {'artists': [{'id': 'a1', 'name': 'Cult of Luna'}, {'id': 'a2', 'name': 'Julie Christmas'}]}},
+            {'track': None},
+            {'track': {'artists': [{'id': None, 'name': 'Local File Artist'}]}},
+            {'track': {'artists': [{'id': 'a1', 'name': 'Cult of Luna'}]}},
+        ]
+
+        self.assertEqual(
+            SpotifyReleaseTracker._extract_artists(items),
+            {'a1': 'Cult of Luna', 'a2': 'Julie Christmas'}
+        )
+
     def test_track_from_playlists_pagination(self):
-        """Test playlist import with pagination."""
-        # Mock first page
-        self.tracker.sp.playlist_tracks.return_value = {
-            'items': [
-                {
-                    'track': {
-                        'artists': [{'id': 'artist1', 'name': 'Artist One'}]
+        """Test playlist import fetches remaining pages by offset, in order."""
+        def mock_playlist_tracks(playlist_id, fields=None, offset=0):
+            return {
+                'items': [
+                    {
+                        'track': {
+                            'artists': [{'id': f'artist{offset}', 'name': f'Artist {offset}'}]
+                        }
                     }
-                }
-            ],
-            'next': 'https://api.spotify.com/v1/playlists/123/tracks?offset=1'
-        }
+                ],
+                'total': 3,
+                'limit': 1
+            }
 
-        # Mock second page
-        self.tracker.sp.next.return_value = {
-            'items': [
-                {
-                    'track': {
-                        'artists': [{'id': 'artist2', 'name': 'Artist Two'}]
-                    }
-                }
-            ],
-            'next': None
-        }
+        self.tracker.sp.playlist_tracks.side_effect = mock_playlist_tracks
 
         # Mock _track_artists_common
         with patch.object(self.tracker, '_track_artists_common') as mock_common:
@@ -376,11 +465,30 @@ class TestSpotifyReleaseTracker(unittest.TestCase):
 
             self.tracker.track_from_playlists(['playlist123'])
 
-            self.tracker.sp.playlist_tracks.assert_called_once()
-            self.tracker.sp.next.assert_called_once()
+            self.assertEqual(self.tracker.sp.playlist_tracks.call_count, 3)
+            self.tracker.sp.next.assert_not_called()
             mock_common.assert_called_once()
             args, _ = mock_common.call_args
-            self.assertEqual(len(args[0]), 2)
+            self.assertEqual(list(args[0]), ['artist0', 'artist1', 'artist2'])
+
+    def test_track_from_multiple_playlists_merges_in_order(self):
+        """Test several playlists are merged in order and one failure is skipped."""
+
+        def mock_playlist_tracks(playlist_id, fields=None, offset=0):
+            if playlist_id == 'broken':
+                raise SpotifyException(404, -1, 'Not found')
+            return {
+                'items': [{'track': {'artists': [{'id': f'{playlist_id}-artist', 'name': playlist_id}]}}],
+                'total': 1,
+                'limit': 100
+            }
+
+        self.tracker.sp.playlist_tracks.side_effect = mock_playlist_tracks
+
+        with patch.object(self.tracker, '_track_artists_common', return_value={}) as mock_common:
+            self.tracker.track_from_playlists(['thrash', 'broken', 'doom'])
+
+        self.assertEqual(list(mock_common.call_args[0][0]), ['thrash-artist', 'doom-artist'])
 
 
 class TestDateBoundaries(unittest.TestCase):
@@ -420,6 +528,44 @@ class TestDateBoundaries(unittest.TestCase):
         release_date = datetime(2024, 3, 2)
         self.assertLess(release_date, tracker.cutoff_date)
 
+    @patch('artist_tracker.tracker.datetime')
+    def test_cutoff_day_kept_with_and_without_isrc(self, mock_datetime):
+        """A cutoff-day release is kept whether its date comes from the album or the ISRC."""
+        # Mid-afternoon, so cutoff_date carries a time of day
+        mock_datetime.now.return_value = datetime(2024, 6, 1, 15, 30)
+        mock_datetime.strptime = datetime.strptime
+
+        tracker = SpotifyReleaseTracker(spotify_client=Mock())
+        tracker.sp.artist_albums.return_value = {
+            'items': [{'id': 'album1', 'name': 'Heartwork', 'release_date': '2024-03-03',
+                       'album_type': 'album'}],
+            'next': None
+        }
+        tracker.sp.albums.return_value = {'albums': [{
+            'id': 'album1',
+            'tracks': {'items': [{'id': 't1', 'name': 'Buried in Hate'},
+                                 {'id': 't2', 'name': 'Blind Bleeding the Blind'},
+                                 {'id': 't3', 'name': 'Carnal Forge'}], 'next': None}
+        }]}
+
+        def full_track(track_id, isrc):
+            return {'id': track_id, 'external_ids': {'isrc': isrc} if isrc else {},
+                    'popularity': 10, 'artists': [{'id': 'carcass_id'}],
+                    'external_urls': {'spotify': f'https://open.spotify.com/track/{track_id}'}}
+        tracker.sp.tracks.return_value = {'tracks': [
+            full_track('t1', None), full_track('t2', 'GBAAA9300001'), full_track('t3', 'GBAAA9300002')
+        ]}
+
+        earliest = {
+            'GBAAA9300001': (datetime(2024, 3, 3), 'Heartwork'),
+            'GBAAA9300002': (datetime(2024, 3, 2), 'Heartwork'),
+        }
+        with patch.object(tracker, '_get_earliest_release_infos', return_value=earliest):
+            releases = tracker._get_recent_releases('carcass_id', 'Carcass')
+
+        self.assertEqual(sorted(r['track'] for r in releases),
+                         ['Blind Bleeding the Blind', 'Buried in Hate'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -437,11 +583,12 @@ class TestRetryLogic(unittest.TestCase):
                     client_secret='test_client_secret'
                 )
                 self.tracker.sp = Mock()
+                # Pacing is covered by TestTokenBucket; keep retries independent of it
+                self.tracker._limiter = Mock()
 
     @patch('artist_tracker.tracker.time.sleep')
     def test_retry_on_server_error(self, mock_sleep):
         """Test that server errors (5xx) trigger retry."""
-        from spotipy.exceptions import SpotifyException
         
         # First call fails with 500, second succeeds
         self.tracker.sp.search.side_effect = [
@@ -458,7 +605,6 @@ class TestRetryLogic(unittest.TestCase):
     @patch('artist_tracker.tracker.time.sleep')
     def test_retry_on_rate_limit(self, mock_sleep):
         """Test rate limit (429) triggers retry with Retry-After header."""
-        from spotipy.exceptions import SpotifyException
         
         rate_limit_error = SpotifyException(429, -1, 'Rate Limited')
         rate_limit_error.headers = {'Retry-After': '2'}
@@ -474,10 +620,69 @@ class TestRetryLogic(unittest.TestCase):
         self.assertEqual(result, 'artist123')
         self.assertEqual(self.tracker.sp.search.call_count, 2)
 
+    @patch('artist_tracker.tracker.random.uniform', return_value=0.5)
+    @patch('artist_tracker.tracker.time.sleep')
+    def test_rate_limit_wait_is_jittered(self, mock_sleep, mock_uniform):
+        """Test Retry-After waits get up to 1s of jitter."""
+
+        rate_limit_error = SpotifyException(429, -1, 'Rate Limited')
+        rate_limit_error.headers = {'Retry-After': '2'}
+        self.tracker.sp.search.side_effect = [
+            rate_limit_error,
+            {'artists': {'items': [{'id': 'artist123', 'name': 'Test'}]}}
+        ]
+
+        self.tracker._search_artist('Test Artist')
+
+        mock_uniform.assert_called_once_with(0, 1.0)
+        mock_sleep.assert_called_once_with(2.5)
+
+    @patch('artist_tracker.tracker.time.sleep')
+    def test_rate_limit_pauses_shared_limiter(self, mock_sleep):
+        """Test a 429 holds back every worker for the Retry-After period."""
+
+        rate_limit_error = SpotifyException(429, -1, 'Rate Limited')
+        rate_limit_error.headers = {'Retry-After': '3'}
+        self.tracker.sp.search.side_effect = [
+            rate_limit_error,
+            {'artists': {'items': [{'id': 'artist123', 'name': 'Test'}]}}
+        ]
+
+        self.tracker._search_artist('Test Artist')
+
+        self.tracker._limiter.pause.assert_called_once_with(3)
+
+    def test_backoff_delay_full_jitter(self):
+        """Test backoff is drawn from [0, capped exponential]."""
+        with patch('artist_tracker.tracker.random.uniform', side_effect=lambda lo, hi: hi):
+            self.assertEqual(self.tracker._backoff_delay(0), self.tracker.RETRY_BASE_DELAY)
+            self.assertEqual(self.tracker._backoff_delay(2), self.tracker.RETRY_BASE_DELAY * 4)
+            self.assertEqual(self.tracker._backoff_delay(20), self.tracker.RETRY_MAX_DELAY)
+
+        for attempt in range(5):
+            delay = self.tracker._backoff_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, self.tracker.RETRY_BASE_DELAY * (2 ** attempt))
+
+    def test_unauthorized_refreshes_token_once(self):
+        """Test a 401 invalidates the shared token and retries a single time."""
+
+        auth = SharedTokenAuthManager(Mock())
+        auth.invalidate = Mock()
+        self.tracker.sp.auth_manager = auth
+        self.tracker.sp.search.side_effect = [
+            SpotifyException(401, -1, 'The access token expired'),
+            SpotifyException(401, -1, 'The access token expired')
+        ]
+
+        with self.assertRaises(SpotifyAPIError):
+            self.tracker._search_artist('Test Artist')
+
+        auth.invalidate.assert_called_once()
+        self.assertEqual(self.tracker.sp.search.call_count, 2)
+
     def test_client_error_no_retry(self):
         """Test that client errors (4xx except 429) don't trigger retry."""
-        from spotipy.exceptions import SpotifyException
-        from artist_tracker.exceptions import SpotifyAPIError
         
         self.tracker.sp.search.side_effect = SpotifyException(400, -1, 'Bad Request')
         
@@ -503,8 +708,6 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_search_artist_api_error(self):
         """Test that API errors are properly propagated."""
-        from spotipy.exceptions import SpotifyException
-        from artist_tracker.exceptions import SpotifyAPIError
         
         self.tracker.sp.search.side_effect = SpotifyException(403, -1, 'Forbidden')
         
@@ -606,6 +809,35 @@ class TestEarliestReleaseDate(unittest.TestCase):
         self.assertIsNone(date)
         self.assertIsNone(album)
 
+    def test_batch_lookup_resolves_each_isrc(self):
+        """Test that several ISRCs are resolved concurrently, one search each."""
+        dates = {'isrc:ISRC_A': '2024-02-01', 'isrc:ISRC_B': '2023-11-17', 'isrc:ISRC_C': '2024-06-07'}
+        self.tracker.sp.search.side_effect = lambda q, **kwargs: {
+            'tracks': {'items': [{'album': {'name': q, 'release_date': dates[q]}}]}
+        }
+
+        info = self.tracker._get_earliest_release_infos(['ISRC_A', 'ISRC_B', 'ISRC_C'])
+
+        self.assertEqual(self.tracker.sp.search.call_count, 3)
+        self.assertEqual(info['ISRC_B'], (datetime(2023, 11, 17), 'isrc:ISRC_B'))
+        self.assertEqual(info['ISRC_C'][0].date(), datetime(2024, 6, 7).date())
+
+    def test_batch_lookup_persists_in_one_write(self):
+        """Test that newly searched ISRCs are written to the database together."""
+        self.tracker.db = Mock()
+        self.tracker.db.get_cached_isrc_lookup.side_effect = \
+            lambda isrc: ('2019-09-20', 'Ire') if isrc == 'ISRC_OLD' else None
+        self.tracker.sp.search.return_value = {
+            'tracks': {'items': [{'album': {'name': 'Cursed', 'release_date': '2024-04-26'}}]}
+        }
+
+        self.tracker._get_earliest_release_infos(['ISRC_OLD', 'ISRC_A', 'ISRC_B'])
+
+        self.tracker.db.cache_isrc_lookup.assert_not_called()
+        self.tracker.db.cache_isrc_lookups_batch.assert_called_once()
+        written = self.tracker.db.cache_isrc_lookups_batch.call_args[0][0]
+        self.assertEqual(sorted(row[0] for row in written), ['ISRC_A', 'ISRC_B'])
+
 
 class TestOutputFormatters(unittest.TestCase):
     """Test output formatting functions."""
@@ -627,7 +859,6 @@ class TestOutputFormatters(unittest.TestCase):
 
     def test_format_releases_tsv(self):
         """Test TSV formatting."""
-        from artist_tracker.tracker import format_releases_tsv
         output = format_releases_tsv(self.sample_releases)
         self.assertIn('2024-05-15', output)
         self.assertIn('Test Artist', output)
@@ -636,14 +867,32 @@ class TestOutputFormatters(unittest.TestCase):
 
     def test_format_releases_csv(self):
         """Test CSV formatting."""
-        from artist_tracker.tracker import format_releases_csv
         output = format_releases_csv(self.sample_releases)
         self.assertIn('date,artist,track', output)  # Header
         self.assertIn('2024-05-15,Test Artist,Test Track', output)
 
+    def test_format_releases_csv_matches_csv_module(self):
+        """Test hand-rolled CSV quoting matches csv.writer for awkward fields."""
+
+        releases = self.sample_releases + [dict(
+            self.sample_releases[0],
+            artist='Emerson, Lake & Palmer',
+            track='The "Great" Gig',
+            album='Line\nBreak',
+            popularity=None
+        )]
+
+        expected = StringIO()
+        writer = csv.writer(expected)
+        writer.writerow(['date', 'artist', 'track', 'album', 'type', 'isrc', 'url', 'popularity'])
+        for r in releases:
+            writer.writerow([r['release_date'], r['artist'], r['track'], r['album'],
+                             r['album_type'], r['isrc'], r['spotify_url'], r.get('popularity', '')])
+
+        self.assertEqual(format_releases_csv(releases), expected.getvalue().rstrip())
+
     def test_format_releases_ids(self):
         """Test IDs formatting."""
-        from artist_tracker.tracker import format_releases_ids
         # Sample releases needs 'track_id' which was missing in setUp
         self.sample_releases[0]['track_id'] = '12345'
         output = format_releases_ids(self.sample_releases)
@@ -651,8 +900,6 @@ class TestOutputFormatters(unittest.TestCase):
 
     def test_format_releases_json(self):
         """Test JSON formatting."""
-        from artist_tracker.tracker import format_releases_json
-        import json
         meta = {'total': 1, 'cutoff_date': '2024-03-01'}
         output = format_releases_json(self.sample_releases, meta)
         data = json.loads(output)
@@ -661,10 +908,20 @@ class TestOutputFormatters(unittest.TestCase):
         self.assertEqual(len(data['releases']), 1)
         self.assertEqual(data['meta']['total'], 1)
 
+    def test_format_releases_json_same_with_and_without_orjson(self):
+        """Test the orjson and stdlib encoders produce identical output."""
+        releases = [dict(self.sample_releases[0], artist='Sólstafir', track='Ótta')]
+        meta = {'total': 1, 'missing_artists': []}
+
+        fast = format_releases_json(releases, meta)
+        with patch('artist_tracker.tracker.orjson', None):
+            fallback = format_releases_json(releases, meta)
+
+        self.assertEqual(fast, fallback)
+        self.assertIn('Sólstafir', fast)
+
     def test_format_releases_pretty(self):
         """Test pretty formatting."""
-        from artist_tracker.tracker import format_releases_pretty
-        from unittest.mock import Mock
 
         # Mock tracker and db
         mock_tracker = Mock()
@@ -677,6 +934,24 @@ class TestOutputFormatters(unittest.TestCase):
         self.assertIn('Test Artist - Test Track', output)
         self.assertIn('🎵', output)
 
+    def test_format_releases_pretty_layout(self):
+        """Test each release is a four-line block followed by a blank line."""
+
+        mock_tracker = Mock()
+        mock_tracker.cutoff_date.date.return_value = '2024-03-01'
+        mock_tracker.lookback_days = 90
+        second = dict(self.sample_releases[0], artist='Gojira', track='Amazonia')
+
+        output = format_releases_pretty(self.sample_releases + [second], mock_tracker)
+
+        self.assertTrue(output.endswith(
+            "   URL: https://spotify.com/track/1\n\n"
+            "🎵 Gojira - Amazonia\n"
+            "   Album: Test Album (single)\n"
+            "   Released: 2024-05-15\n"
+            "   URL: https://spotify.com/track/1\n"
+        ))
+
 
 class TestCustomLookbackDays(unittest.TestCase):
     """Test custom lookback days functionality."""
@@ -736,11 +1011,10 @@ class TestMaxPerArtist(unittest.TestCase):
         }
 
         # Mock album with 5 tracks
-        tracker.sp.album_tracks.return_value = {
-            'items': [
-                {'id': f'track{i}', 'name': f'Track {i}'} for i in range(5)
-            ]
-        }
+        tracker.sp.albums.return_value = {'albums': [{
+            'id': 'album1',
+            'tracks': {'items': [{'id': f'track{i}', 'name': f'Track {i}'} for i in range(5)]}
+        }]}
 
         # Mock track details with different popularity
         def mock_track(track_id):
@@ -754,7 +1028,7 @@ class TestMaxPerArtist(unittest.TestCase):
                 'artists': [{'id': 'artist123', 'name': 'Test Artist'}]
             }
 
-        tracker.sp.track.side_effect = mock_track
+        tracker.sp.tracks.side_effect = lambda ids: {'tracks': [mock_track(i) for i in ids]}
 
         # Get releases with max_per_artist=2
         releases = tracker._get_recent_releases('artist123', 'Test Artist', max_tracks=2)
@@ -824,7 +1098,9 @@ class TestSmartFilteringWithGroupedAlbums(unittest.TestCase):
                 ]
             }
 
-        tracker.sp.album_tracks.side_effect = mock_album_tracks
+        tracker.sp.albums.side_effect = lambda ids: {
+            'albums': [{'id': i, 'tracks': mock_album_tracks(i)} for i in ids]
+        }
 
         # Mock track details
         def mock_track(track_id):
@@ -838,7 +1114,7 @@ class TestSmartFilteringWithGroupedAlbums(unittest.TestCase):
                 'artists': [{'id': 'artist123', 'name': 'Megadeth'}]
             }
 
-        tracker.sp.track.side_effect = mock_track
+        tracker.sp.tracks.side_effect = lambda ids: {'tracks': [mock_track(i) for i in ids]}
 
         # Mock ISRC search to return empty results (no earlier releases found)
         tracker.sp.search.return_value = {'tracks': {'items': []}}
@@ -856,5 +1132,933 @@ class TestSmartFilteringWithGroupedAlbums(unittest.TestCase):
         self.assertIn('I Don\'t Care', release_albums)
 
 
+    def _paged_albums_tracker(self, first_page_items):
+        """Build a tracker whose first album page has a next page."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock(), lookback_days=365)
+        tracker.cutoff_date = datetime(2025, 1, 10)
+        tracker.sp.artist_albums.return_value = {
+            'items': first_page_items,
+            'next': 'https://api.spotify.com/v1/artists/artist123/albums?offset=50'
+        }
+        tracker.sp.next.return_value = {'items': [], 'next': None}
+        tracker.sp.albums.side_effect = lambda ids: {
+            'albums': [{'id': i, 'tracks': {'items': [], 'next': None}} for i in ids]
+        }
+        return tracker
+
+    def test_stops_paging_at_old_compilation(self):
+        """Compilations are the last group, so an old one ends pagination."""
+        tracker = self._paged_albums_tracker([
+            {'id': 'c1', 'name': 'Warheads on Foreheads', 'release_date': '2019-03-22',
+             'album_type': 'compilation', 'album_group': 'compilation'}
+        ])
+
+        tracker._get_recent_releases('artist123', 'Megadeth')
+
+        tracker.sp.next.assert_not_called()
+
+    def test_keeps_paging_past_old_single(self):
+        """An old single does not end pagination; compilations may follow."""
+        tracker = self._paged_albums_tracker([
+            {'id': 's1', 'name': 'Dystopia', 'release_date': '2015-11-20',
+             'album_type': 'single', 'album_group': 'single'}
+        ])
+
+        tracker._get_recent_releases('artist123', 'Megadeth')
+
+        tracker.sp.next.assert_called_once()
+
+
+class TestBatchedTrackLookups(unittest.TestCase):
+    """Test batched track detail lookups and album track pagination."""
+
+    def setUp(self):
+        """Set up a tracker with a fresh Spotify mock."""
+        self.tracker = SpotifyReleaseTracker('test_id', 'test_secret')
+        self.tracker.sp = Mock()
+
+    @staticmethod
+    def _full_track(track_id):
+        return {
+            'id': track_id,
+            'name': f'Track {track_id}',
+            'external_ids': {'isrc': f'ISRC{track_id}'},
+            'external_urls': {'spotify': f'https://spotify.com/track/{track_id}'},
+            'popularity': 50,
+            'artists': [{'id': 'artist123', 'name': 'Gojira'}]
+        }
+
+    def test_get_full_tracks_batches_by_fifty(self):
+        """60 track IDs should be fetched in two requests."""
+        self.tracker.sp.tracks.side_effect = lambda ids: {
+            'tracks': [self._full_track(i) for i in ids]
+        }
+
+        track_ids = [f't{i}' for i in range(60)]
+        full_tracks, complete = self.tracker._get_full_tracks(track_ids)
+
+        self.assertEqual(self.tracker.sp.tracks.call_count, 2)
+        self.assertEqual(len(self.tracker.sp.tracks.call_args_list[0][0][0]), 50)
+        self.assertEqual(len(self.tracker.sp.tracks.call_args_list[1][0][0]), 10)
+        self.assertEqual(set(full_tracks), set(track_ids))
+        self.assertTrue(complete)
+
+    def test_get_album_tracks_batches_by_twenty(self):
+        """45 album IDs should be fetched in three requests."""
+        self.tracker.sp.albums.side_effect = lambda ids: {'albums': [
+            {'id': i, 'tracks': {'items': [{'id': f'{i}_t1', 'name': 'Track'}], 'next': None}}
+            for i in ids
+        ] + [None]}
+
+        album_ids = [f'a{i}' for i in range(45)]
+        album_tracks, complete = self.tracker._get_album_tracks(album_ids)
+
+        self.assertEqual(
+            [len(c[0][0]) for c in self.tracker.sp.albums.call_args_list], [20, 20, 5]
+        )
+        self.assertEqual(set(album_tracks), set(album_ids))
+        self.assertTrue(complete)
+        self.tracker.sp.album_tracks.assert_not_called()
+
+    def test_get_full_tracks_skips_missing_entries(self):
+        """Null entries for unavailable tracks should be skipped."""
+        self.tracker.sp.tracks.return_value = {
+            'tracks': [self._full_track('t1'), None]
+        }
+
+        full_tracks, _ = self.tracker._get_full_tracks(['t1', 'gone'])
+
+        self.assertEqual(list(full_tracks), ['t1'])
+
+    @patch('artist_tracker.tracker.datetime')
+    def test_album_tracks_are_paginated(self, mock_datetime):
+        """Tracks beyond the first embedded page should be included."""
+        mock_datetime.now.return_value = datetime(2024, 6, 1)
+        mock_datetime.strptime = datetime.strptime
+
+        # Cutoff date is computed at construction, so rebuild under the patch
+        self.tracker = SpotifyReleaseTracker('test_id', 'test_secret')
+        self.tracker.sp = Mock()
+
+        self.tracker.sp.artist_albums.return_value = {
+            'items': [{
+                'id': 'album1',
+                'name': 'Fortitude',
+                'release_date': '2024-05-15',
+                'album_type': 'album'
+            }],
+            'next': None
+        }
+        self.tracker.sp.albums.return_value = {'albums': [{
+            'id': 'album1',
+            'tracks': {
+                'items': [{'id': 't1', 'name': 'Born For One Thing'}],
+                'next': 'https://api.spotify.com/v1/albums/album1/tracks?offset=1'
+            }
+        }]}
+        self.tracker.sp.next.return_value = {
+            'items': [{'id': 't2', 'name': 'Amazonia'}],
+            'next': None
+        }
+        self.tracker.sp.tracks.side_effect = lambda ids: {
+            'tracks': [self._full_track(i) for i in ids]
+        }
+
+        releases = self.tracker._get_recent_releases('artist123', 'Gojira')
+
+        self.tracker.sp.next.assert_called_once()
+        self.tracker.sp.tracks.assert_called_once_with(['t1', 't2'])
+        self.assertEqual(len(releases), 2)
+
+    def test_long_albums_fetch_remaining_pages_concurrently(self):
+        """Pages after the embedded one are requested by offset for every album."""
+        def embedded(album_id, total):
+            return {
+                'id': album_id,
+                'tracks': {
+                    'items': [{'id': f'{album_id}-0', 'name': 'Intro'}],
+                    'limit': 1,
+                    'total': total,
+                    'next': f'https://api.spotify.com/v1/albums/{album_id}/tracks?offset=1&limit=1'
+                }
+            }
+
+        self.tracker.sp.albums.return_value = {'albums': [embedded('a1', 3), embedded('a2', 2)]}
+        self.tracker.sp.album_tracks.side_effect = lambda album_id, limit, offset: {
+            'items': [{'id': f'{album_id}-{offset}', 'name': 'Track'}]
+        }
+
+        album_tracks, _ = self.tracker._get_album_tracks(['a1', 'a2'])
+
+        self.assertEqual([t['id'] for t in album_tracks['a1']], ['a1-0', 'a1-1', 'a1-2'])
+        self.assertEqual([t['id'] for t in album_tracks['a2']], ['a2-0', 'a2-1'])
+        self.assertEqual(self.tracker.sp.album_tracks.call_count, 3)
+        self.tracker.sp.next.assert_not_called()
+
+    @patch('artist_tracker.tracker.time.sleep')
+    def test_failed_track_page_drops_album(self, mock_sleep):
+        """An album whose extra page can't be fetched is omitted and the result marked incomplete."""
+        def embedded(album_id):
+            return {
+                'id': album_id,
+                'tracks': {
+                    'items': [{'id': f'{album_id}-0', 'name': 'Intro'}],
+                    'limit': 1,
+                    'total': 2,
+                    'next': f'https://api.spotify.com/v1/albums/{album_id}/tracks?offset=1&limit=1'
+                }
+            }
+
+        def album_tracks_page(album_id, limit, offset):
+            if album_id == 'a1':
+                raise SpotifyException(500, -1, 'Server error')
+            return {'items': [{'id': f'{album_id}-{offset}', 'name': 'Track'}]}
+
+        self.tracker._limiter = Mock()
+        self.tracker.sp.albums.return_value = {'albums': [embedded('a1'), embedded('a2')]}
+        self.tracker.sp.album_tracks.side_effect = album_tracks_page
+
+        album_tracks, complete = self.tracker._get_album_tracks(['a1', 'a2'])
+
+        self.assertEqual(list(album_tracks), ['a2'])
+        self.assertEqual([t['id'] for t in album_tracks['a2']], ['a2-0', 'a2-1'])
+        self.assertFalse(complete)
+        # The failing page was retried before giving up
+        self.assertGreater(
+            sum(1 for c in self.tracker.sp.album_tracks.call_args_list if c[0][0] == 'a1'), 1
+        )
+
+
+class TestReleaseCaching(unittest.TestCase):
+    """Test writing fetched releases to the database cache."""
+
+    def setUp(self):
+        """Set up a tracker backed by a mocked database."""
+        self.db = Mock()
+        self.tracker = SpotifyReleaseTracker(spotify_client=Mock(), db=self.db)
+
+    def test_releases_cached_in_one_batch(self):
+        """All of an artist's releases should be cached in a single write."""
+        self.tracker.force_refresh = True
+        self.tracker.cutoff_date = datetime(2024, 1, 1)
+        self.tracker.sp.artist_albums.return_value = {
+            'items': [{'id': 'album1', 'name': 'Under the Sign of the Black Mark',
+                       'release_date': '2024-05-01', 'album_type': 'album'}],
+            'next': None
+        }
+        self.tracker.sp.albums.return_value = {'albums': [{
+            'id': 'album1',
+            'tracks': {'items': [{'id': 't1', 'name': 'Nocturnal Obeisance'}, {'id': 't2', 'name': 'Massacre'}]}
+        }]}
+        self.tracker.sp.tracks.side_effect = lambda ids: {'tracks': [
+            {'id': i, 'external_ids': {}, 'popularity': 10,
+             'external_urls': {'spotify': f'https://open.spotify.com/track/{i}'},
+             'artists': [{'id': 'bathory_id'}]}
+            for i in ids
+        ]}
+
+        self.tracker._get_recent_releases('bathory_id', 'Bathory')
+
+        self.db.cache_releases_batch.assert_called_once()
+        cached = self.db.cache_releases_batch.call_args[0][0]
+        self.assertEqual([r['track_id'] for r in cached], ['t1', 't2'])
+
+
+class TestConcurrencySettings(unittest.TestCase):
+    """Test configurable artist fan-out."""
+
+    def test_default_max_workers(self):
+        """Tracker should default to MAX_WORKERS concurrent artists."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock())
+        self.assertEqual(tracker.max_workers, SpotifyReleaseTracker.MAX_WORKERS)
+
+    @patch('artist_tracker.tracker.spotipy.Spotify')
+    @patch('artist_tracker.tracker.create_optimized_session')
+    def test_connection_pool_sized_for_workers(self, mock_session, mock_spotify):
+        """HTTP pool should hold at least one connection per worker."""
+        tracker = SpotifyReleaseTracker(auth_manager=Mock(), max_workers=32)
+        mock_session.assert_called_once_with(
+            pool_maxsize=32, response_store=None, refresh_cache=False, rate_limiter=tracker._limiter
+        )
+
+    @patch('artist_tracker.tracker.spotipy.Spotify')
+    @patch('artist_tracker.tracker.create_optimized_session')
+    def test_own_session_rate_limits_instead_of_call_api(self, mock_session, mock_spotify):
+        """With the tracker's own session, tokens are taken per network request, not per call."""
+        tracker = SpotifyReleaseTracker(auth_manager=Mock())
+        tracker._limiter = Mock()
+
+        tracker._call_api('albums', Mock(return_value={}))
+
+        tracker._limiter.acquire.assert_not_called()
+
+    def test_injected_client_rate_limited_in_call_api(self):
+        """An injected client has no limited session, so _call_api takes the token."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock())
+        tracker._limiter = Mock()
+
+        tracker._call_api('albums', Mock(return_value={}))
+
+        tracker._limiter.acquire.assert_called_once()
+
+    @patch('artist_tracker.tracker.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    def test_track_artists_uses_max_workers(self, mock_executor):
+        """Fan-out should use the configured worker count."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock(), max_workers=3)
+
+        with patch.object(tracker, '_get_recent_releases', return_value=[]):
+            tracker._track_artists_common({'id1': 'Opeth'})
+
+        mock_executor.assert_called_once_with(max_workers=3)
+
+    @patch('artist_tracker.tracker.spotipy.Spotify')
+    @patch('artist_tracker.tracker.create_optimized_session')
+    def test_close_releases_http_session(self, mock_session, mock_spotify):
+        """close() should close the pooled session the tracker created."""
+        tracker = SpotifyReleaseTracker(auth_manager=Mock())
+
+        tracker.close()
+        tracker.close()
+
+        mock_session.return_value.close.assert_called_once()
+
+    @patch('artist_tracker.tracker.spotipy.Spotify')
+    @patch('artist_tracker.tracker.create_optimized_session')
+    def test_close_prunes_expired_responses(self, mock_session, mock_spotify):
+        """close() should drop stored responses older than the longest cache TTL."""
+        db = Mock()
+        db.get_last_run_timestamp.return_value = None
+        tracker = SpotifyReleaseTracker(auth_manager=Mock(), db=db)
+
+        tracker.close()
+
+        db.clear_expired_http_responses.assert_called_once_with(ConditionalRequestSession.MAX_CACHE_AGE)
+
+    def test_io_pool_is_shared_and_closed(self):
+        """Page and ISRC requests should reuse one pool until close()."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock(), max_workers=3)
+
+        pool = tracker._io_executor()
+        self.assertIs(tracker._io_executor(), pool)
+        self.assertEqual(pool._max_workers, 3)
+
+        tracker.close()
+        self.assertIsNone(tracker._io_pool)
+        self.assertIsNot(tracker._io_executor(), pool)
+        tracker.close()
+
+    def test_in_flight_futures_are_bounded(self):
+        """No more than 2 * max_workers artists should be queued at once."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock(), max_workers=2)
+        lock = threading.Lock()
+        state = {'in_flight': 0, 'peak': 0}
+        real_submit = ThreadPoolExecutor.submit
+
+        def counting_submit(executor, fn, *args, **kwargs):
+            with lock:
+                state['in_flight'] += 1
+                state['peak'] = max(state['peak'], state['in_flight'])
+            future = real_submit(executor, fn, *args, **kwargs)
+
+            def finished(_):
+                with lock:
+                    state['in_flight'] -= 1
+            future.add_done_callback(finished)
+            return future
+
+        artists = {f'id{i}': f'Artist {i}' for i in range(50)}
+        with patch.object(ThreadPoolExecutor, 'submit', counting_submit):
+            with patch.object(tracker, '_get_recent_releases', return_value=[]) as mock_fetch:
+                results = tracker._track_artists_common(artists)
+
+        self.assertEqual(mock_fetch.call_count, 50)
+        self.assertEqual(len(results['missing_artists']), 50)
+        self.assertLessEqual(state['peak'], 4)
+
+    @patch('artist_tracker.tracker.tqdm', wraps=tqdm)
+    def test_progress_bar_only_for_large_runs(self, mock_tqdm):
+        """Small runs should not draw a per-artist progress bar."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock(), max_workers=2)
+        threshold = SpotifyReleaseTracker.PROGRESS_BAR_MIN_ARTISTS
+
+        with patch.object(tracker, '_get_recent_releases', return_value=[]):
+            tracker._track_artists_common({'id1': 'Opeth', 'id2': 'Gojira'})
+            self.assertTrue(mock_tqdm.call_args.kwargs['disable'])
+
+            tracker._track_artists_common({f'id{i}': f'Artist {i}' for i in range(threshold)})
+            self.assertFalse(mock_tqdm.call_args.kwargs['disable'])
+
+    def test_on_releases_receives_each_artist_batch(self):
+        """Streaming callback should see every artist's releases before the final sort."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock(), max_workers=2)
+        releases = {
+            'id1': [{'release_date': '2024-01-10', 'artist': 'Opeth'}],
+            'id2': [{'release_date': '2024-03-05', 'artist': 'Gojira'}],
+            'id3': [],
+        }
+        batches = []
+
+        with patch.object(tracker, '_get_recent_releases',
+                          side_effect=lambda artist_id, *args: releases[artist_id]):
+            results = tracker._track_artists_common(
+                {'id1': 'Opeth', 'id2': 'Gojira', 'id3': 'Mastodon'}, on_releases=batches.append
+            )
+
+        self.assertCountEqual(batches, [releases['id1'], releases['id2']])
+        self.assertEqual([r['artist'] for r in results['releases']], ['Gojira', 'Opeth'])
+
+
+class TestArtistLookupCaching(unittest.TestCase):
+    """Test caching of artist searches and ID-to-name lookups."""
+
+    def setUp(self):
+        """Set up a tracker backed by a mocked database."""
+        self.db = Mock()
+        self.db.get_cached_artist_lookup.return_value = None
+        self.tracker = SpotifyReleaseTracker(spotify_client=Mock(), db=self.db)
+
+    def test_get_artist_name_cached_in_memory(self):
+        """Repeat name lookups should not hit the API."""
+        self.tracker.sp.artist.return_value = {'name': 'Gojira'}
+
+        self.assertEqual(self.tracker._get_artist_name('gojira_id'), 'Gojira')
+        self.assertEqual(self.tracker._get_artist_name('gojira_id'), 'Gojira')
+
+        self.tracker.sp.artist.assert_called_once_with('gojira_id')
+        self.db.cache_artist_lookup.assert_called_once_with('artist:gojira_id', 'Gojira')
+
+    def test_search_artist_uses_persistent_cache(self):
+        """A search resolved on a previous run should not hit the API."""
+        self.db.get_cached_artist_lookup.return_value = 'gojira_id'
+
+        self.assertEqual(self.tracker._search_artist('Gojira'), 'gojira_id')
+
+        self.db.get_cached_artist_lookup.assert_called_once_with('search:gojira')
+        self.tracker.sp.search.assert_not_called()
+
+    def test_force_refresh_bypasses_cache(self):
+        """force_refresh should always query the API."""
+        self.tracker.force_refresh = True
+        self.tracker.sp.artist.return_value = {'name': 'Gojira'}
+
+        self.tracker._get_artist_name('gojira_id')
+        self.tracker._get_artist_name('gojira_id')
+
+        self.assertEqual(self.tracker.sp.artist.call_count, 2)
+        self.db.get_cached_artist_lookup.assert_not_called()
+
+    def test_search_miss_is_cached(self):
+        """A search that found nothing should not be repeated while the miss is fresh."""
+        self.tracker.sp.search.return_value = {'artists': {'items': []}}
+
+        self.assertIsNone(self.tracker._search_artist('Nonexistent Doom Band'))
+        self.db.cache_artist_lookup.assert_called_once_with(
+            'search-miss:nonexistent doom band', 'Nonexistent Doom Band'
+        )
+
+        self.db.get_cached_artist_lookup.side_effect = (
+            lambda key, max_age_hours=168: 'Nonexistent Doom Band' if key.startswith('search-miss:') else None
+        )
+        self.assertIsNone(self.tracker._search_artist('Nonexistent Doom Band'))
+
+        self.tracker.sp.search.assert_called_once()
+        self.db.get_cached_artist_lookup.assert_called_with(
+            'search-miss:nonexistent doom band', max_age_hours=SpotifyReleaseTracker.SEARCH_MISS_TTL_HOURS
+        )
+
+    def test_api_error_falls_back_to_expired_lookup(self):
+        """An old cached name should be served when the API call fails."""
+        self.db.get_cached_artist_lookup.side_effect = (
+            lambda key, max_age_hours=168: 'Gojira' if max_age_hours is None else None
+        )
+        self.tracker.sp.artist.side_effect = Exception("503 Service Unavailable")
+
+        self.assertEqual(self.tracker._get_artist_name('gojira_id'), 'Gojira')
+        self.db.get_cached_artist_lookup.assert_called_with('artist:gojira_id', max_age_hours=None)
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test the in-memory LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """A get should protect an entry from the next eviction."""
+        cache = LRUCache(capacity=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+
+    def test_concurrent_access_at_capacity(self):
+        """Workers hitting a full cache at once should never raise."""
+        cache = LRUCache(capacity=8)
+
+        def worker(n):
+            for i in range(2000):
+                key = f'{n}-{i % 16}'
+                cache.put(key, i)
+                cache.get(key)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+
+        self.assertEqual(cache.size(), 8)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the proactive rate limiter."""
+
+    @patch('artist_tracker.tracker.time.sleep')
+    @patch('artist_tracker.tracker.time.monotonic', return_value=100.0)
+    def test_burst_does_not_block(self, mock_monotonic, mock_sleep):
+        """Calls within the burst size should proceed immediately."""
+        bucket = TokenBucket(rate_per_sec=10, burst=5)
+        for _ in range(5):
+            bucket.acquire()
+        mock_sleep.assert_not_called()
+
+    @patch('artist_tracker.tracker.time.sleep')
+    @patch('artist_tracker.tracker.time.monotonic')
+    def test_empty_bucket_waits_for_refill(self, mock_monotonic, mock_sleep):
+        """An empty bucket should sleep for the token deficit."""
+        clock = [100.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+
+        def advance(seconds):
+            clock[0] += seconds
+        mock_sleep.side_effect = advance
+
+        bucket = TokenBucket(rate_per_sec=4, burst=1)
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_sleep.assert_called_once_with(0.25)
+
+    @patch('artist_tracker.tracker.time.sleep')
+    @patch('artist_tracker.tracker.time.monotonic')
+    def test_pause_blocks_then_resumes_without_burst(self, mock_monotonic, mock_sleep):
+        """A pause should hold callers back, then restart at the steady rate."""
+        clock = [100.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+        bucket = TokenBucket(rate_per_sec=4, burst=10)
+        bucket.pause(3)
+        bucket.acquire()
+
+        self.assertEqual(mock_sleep.call_args_list[0][0][0], 3)
+        self.assertAlmostEqual(clock[0], 103.25)
+
+    def test_call_api_acquires_token(self):
+        """Every API call should draw from the shared limiter."""
+        tracker = SpotifyReleaseTracker(spotify_client=Mock())
+        tracker._limiter = Mock()
+
+        tracker._call_api('artist', tracker.sp.artist, 'artist_id')
+
+        tracker._limiter.acquire.assert_called_once()
+
+
+class TestEmptyArtistSkipping(unittest.TestCase):
+    """Test skipping artists that had no releases on a recent run."""
+
+    def setUp(self):
+        """Set up a tracker backed by a mocked database."""
+        self.db = Mock()
+        self.db.get_empty_artists.return_value = {'bathory_id'}
+        self.tracker = SpotifyReleaseTracker(spotify_client=Mock(), db=self.db)
+
+    def test_empty_artists_not_fetched(self):
+        """Known-empty artists should be reported missing without API calls."""
+        with patch.object(self.tracker, '_get_recent_releases', return_value=[]) as mock_fetch:
+            results = self.tracker._track_artists_common({
+                'bathory_id': 'Bathory',
+                'emperor_id': 'Emperor'
+            })
+
+        mock_fetch.assert_called_once_with('emperor_id', 'Emperor', None)
+        self.assertIn('bathory_id', results['missing_artists'])
+        self.assertIn('emperor_id', results['missing_artists'])
+
+    def test_force_refresh_fetches_all(self):
+        """force_refresh should ignore the empty artist cache."""
+        self.tracker.force_refresh = True
+
+        with patch.object(self.tracker, '_get_recent_releases', return_value=[]) as mock_fetch:
+            self.tracker._track_artists_common({'bathory_id': 'Bathory'})
+
+        mock_fetch.assert_called_once()
+        self.db.get_empty_artists.assert_not_called()
+
+    def test_empty_result_is_recorded(self):
+        """An artist with no recent releases should be marked empty."""
+        self.tracker.force_refresh = True
+        self.tracker.sp.artist_albums.return_value = {'items': [], 'next': None}
+
+        self.tracker._get_recent_releases('bathory_id', 'Bathory')
+
+        self.db.mark_artists_empty.assert_called_once_with(['bathory_id'], self.tracker.cutoff_date_str)
+
+    @patch('artist_tracker.tracker.time.sleep')
+    def test_failed_album_fetch_is_not_recorded_empty(self, mock_sleep):
+        """An empty result caused by API errors should not mark the artist empty."""
+        self.tracker.force_refresh = True
+        self.tracker.cutoff_date = datetime(2024, 1, 1)
+        self.tracker.sp.artist_albums.return_value = {
+            'items': [{'id': 'album1', 'name': 'Blood Fire Death',
+                       'release_date': '2024-05-01', 'album_type': 'album'}],
+            'next': None
+        }
+        self.tracker.sp.albums.side_effect = SpotifyException(503, -1, 'Service Unavailable')
+
+        releases = self.tracker._get_recent_releases('bathory_id', 'Bathory')
+
+        self.assertEqual(releases, [])
+        self.db.mark_artists_empty.assert_not_called()
+
+    def test_failed_album_page_is_not_recorded_empty(self):
+        """A failed next-page fetch should not mark the artist empty."""
+        self.tracker.force_refresh = True
+        self.tracker.sp.artist_albums.return_value = {
+            'items': [], 'next': 'https://api.spotify.com/v1/artists/bathory_id/albums?offset=50'
+        }
+        self.tracker.sp.next.side_effect = Exception('Connection reset')
+
+        self.tracker._get_recent_releases('bathory_id', 'Bathory')
+
+        self.db.mark_artists_empty.assert_not_called()
+
+
+class TestSharedTokenAuthManager(unittest.TestCase):
+    """Test the shared, lock-guarded access token."""
+
+    def setUp(self):
+        """Set up a wrapped auth manager whose token expires in an hour."""
+        self.inner = Mock()
+        self.inner.get_access_token.return_value = 'token-1'
+        self.inner.cache_handler.get_cached_token.return_value = {'expires_at': 10_000}
+        self.auth = SharedTokenAuthManager(self.inner)
+
+    @patch('artist_tracker.tracker.time.time', return_value=5_000)
+    def test_token_reused_while_valid(self, mock_time):
+        """The wrapped manager should only be asked once while the token is fresh."""
+        self.assertEqual(self.auth.get_access_token(as_dict=False), 'token-1')
+        self.assertEqual(self.auth.get_access_token(as_dict=False), 'token-1')
+        self.inner.get_access_token.assert_called_once_with(as_dict=False)
+
+    @patch('artist_tracker.tracker.time.time')
+    def test_token_refreshed_before_expiry(self, mock_time):
+        """The token should be refreshed within REFRESH_MARGIN of expiry."""
+        mock_time.return_value = 5_000
+        self.auth.get_access_token()
+
+        self.inner.get_access_token.return_value = 'token-2'
+        self.inner.cache_handler.get_cached_token.return_value = {'expires_at': 13_600}
+        mock_time.return_value = 10_000 - SharedTokenAuthManager.REFRESH_MARGIN
+
+        self.assertEqual(self.auth.get_access_token(), 'token-2')
+        self.inner.get_access_token.assert_any_call(as_dict=False, check_cache=False)
+
+    @patch('artist_tracker.tracker.time.time')
+    def test_unrenewed_token_not_refetched_on_every_call(self, mock_time):
+        """A token the wrapped manager won't renew yet should be refreshed only once."""
+        mock_time.return_value = 5_000
+        self.auth.get_access_token()
+
+        # Inside REFRESH_MARGIN but outside spotipy's threshold: still the old token
+        mock_time.return_value = 10_000 - 100
+        self.inner.get_access_token.reset_mock()
+        for _ in range(50):
+            self.assertEqual(self.auth.get_access_token(), 'token-1')
+
+        forced = [c for c in self.inner.get_access_token.call_args_list
+                  if c.kwargs.get('check_cache') is False]
+        self.assertEqual(len(forced), 1)
+        self.assertEqual(self.inner.get_access_token.call_count, 2)
+
+    @patch('artist_tracker.tracker.time.time', return_value=5_000)
+    def test_concurrent_callers_refresh_once(self, mock_time):
+        """Workers racing on an empty cache should trigger a single refresh."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: self.auth.get_access_token(), range(32)))
+
+        self.assertEqual(set(tokens), {'token-1'})
+        self.inner.get_access_token.assert_called_once()
+
+    @patch('artist_tracker.tracker.time.time', return_value=5_000)
+    def test_invalidate_forces_refresh(self, mock_time):
+        """A rejected token should be replaced even if it looks unexpired."""
+        self.inner.cache_handler.get_cached_token.return_value = {'expires_at': 10_000}
+        self.auth.get_access_token()
+
+        self.auth.invalidate()
+        self.inner.get_access_token.return_value = 'token-2'
+
+        self.assertEqual(self.auth.get_access_token(), 'token-2')
+        self.inner.get_access_token.assert_any_call(as_dict=False, check_cache=False)
+
+    @patch('artist_tracker.tracker.time.time', return_value=5_000)
+    def test_invalidate_uses_refresh_token_for_oauth(self, mock_time):
+        """OAuth tokens should be renewed with the refresh token."""
+        self.inner.cache_handler.get_cached_token.return_value = {
+            'expires_at': 10_000, 'refresh_token': 'refresh-me'
+        }
+        self.auth.get_access_token()
+
+        self.auth.invalidate()
+        self.auth.get_access_token()
+
+        self.inner.refresh_access_token.assert_called_once_with('refresh-me')
+
+    def test_other_attributes_delegated(self):
+        """Attributes spotipy reads from the auth manager should pass through."""
+        self.assertIs(self.auth.cache_handler, self.inner.cache_handler)
+
+
+class TestOptimizedSession(unittest.TestCase):
+    """Test the pooled requests session used for Spotify calls."""
+
+    def _response(self, body: bytes):
+        response = requests.Response()
+        response._content = body
+        response.status_code = 200
+        return response
+
+    @unittest.skipIf(tracker_module.orjson is None, "orjson not installed")
+    def test_json_decoded_with_orjson(self):
+        """Responses should decode through orjson when it is installed."""
+        session = create_optimized_session()
+        response = self._response(b'{"name": "Converge"}')
+
+        for hook in session.hooks['response']:
+            response = hook(response)
+
+        with patch.object(tracker_module.orjson, 'loads', wraps=tracker_module.orjson.loads) as mock_loads:
+            self.assertEqual(response.json(), {'name': 'Converge'})
+        mock_loads.assert_called_once()
+
+    @unittest.skipIf(tracker_module.orjson is None, "orjson not installed")
+    def test_invalid_json_raises_value_error(self):
+        """Undecodable bodies should still raise ValueError, as spotipy expects."""
+        session = create_optimized_session()
+        response = self._response(b'')
+
+        for hook in session.hooks['response']:
+            response = hook(response)
+
+        with self.assertRaises(ValueError):
+            response.json()
+
+    @patch.object(tracker_module, 'orjson', None)
+    def test_no_hook_without_orjson(self):
+        """Without orjson the session should use requests' own decoder."""
+        session = create_optimized_session()
+        self.assertEqual(session.hooks['response'], [])
+
+
+class TestConditionalRequestSession(unittest.TestCase):
+    """Test TTL caching and ETag revalidation of cacheable endpoints."""
+
+    ALBUMS_URL = 'https://api.spotify.com/v1/artists/artist123/albums'
+    PLAYLIST_URL = 'https://api.spotify.com/v1/playlists/playlist123/tracks'
+
+    def setUp(self):
+        """Set up a session backed by an in-memory response store."""
+        self.store = {}
+        store = Mock()
+        store.get_http_response.side_effect = self.store.get
+        store.cache_http_response.side_effect = \
+            lambda url, etag, body: self.store.__setitem__(url, (etag, body, 0.0))
+        store.touch_http_response.side_effect = \
+            lambda url: self.store.__setitem__(url, self.store[url][:2] + (0.0,))
+        self.session = ConditionalRequestSession(store)
+
+    def _response(self, status, body=b'', etag=None):
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        if etag:
+            response.headers['ETag'] = etag
+        return response
+
+    def _age_entries(self, seconds):
+        for url, (etag, body, age) in self.store.items():
+            self.store[url] = (etag, body, age + seconds)
+
+    @patch('requests.Session.request')
+    def test_fresh_entry_served_without_request(self, mock_request):
+        """Responses within the TTL should not touch the network."""
+        mock_request.return_value = self._response(200, b'{"items": []}', etag='"v1"')
+
+        self.session.get(self.ALBUMS_URL, params={'limit': 50})
+        second = self.session.get(self.ALBUMS_URL, params={'limit': 50})
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), {'items': []})
+
+    @patch('requests.Session.request')
+    def test_cached_responses_do_not_consume_rate_limit(self, mock_request):
+        """Only requests that reach the network should take a rate-limit token."""
+        mock_request.return_value = self._response(200, b'{"items": []}', etag='"v1"')
+        self.session.rate_limiter = Mock()
+
+        for _ in range(5):
+            self.session.get(self.ALBUMS_URL, params={'limit': 50})
+        self.session.get('https://api.spotify.com/v1/search', params={'q': 'Opeth'})
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.session.rate_limiter.acquire.call_count, 2)
+
+    @patch('requests.Session.request')
+    def test_stale_entry_revalidated(self, mock_request):
+        """A stale entry should be revalidated and a 304 answered from the store."""
+        mock_request.side_effect = [
+            self._response(200, b'{"items": []}', etag='"v1"'),
+            self._response(304)
+        ]
+
+        self.session.get(self.ALBUMS_URL, params={'limit': 50})
+        self._age_entries(ConditionalRequestSession.CACHE_TTLS[0][1])
+        second = self.session.get(self.ALBUMS_URL, params={'limit': 50})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, b'{"items": []}')
+        self.assertEqual(mock_request.call_args[1]['headers']['If-None-Match'], '"v1"')
+        # The 304 makes the entry fresh again
+        self.assertEqual(next(iter(self.store.values()))[2], 0.0)
+
+    @patch('requests.Session.request')
+    def test_playlist_pages_always_revalidated(self, mock_request):
+        """Playlist pages have no TTL and are revalidated on every request."""
+        mock_request.side_effect = [
+            self._response(200, b'{"items": []}', etag='"p1"'),
+            self._response(304)
+        ]
+
+        self.session.get(self.PLAYLIST_URL, params={'offset': 0})
+        self.session.get(self.PLAYLIST_URL, params={'offset': 0})
+
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch('requests.Session.request')
+    def test_album_and_track_lookups_cached(self, mock_request):
+        """Batched album and track lookups should be cached even without an ETag."""
+        mock_request.return_value = self._response(200, b'{"albums": []}')
+
+        self.session.get('https://api.spotify.com/v1/albums/?ids=a,b')
+        self.session.get('https://api.spotify.com/v1/albums/?ids=a,b')
+        self.session.get('https://api.spotify.com/v1/tracks/?ids=c,d')
+        self.session.get('https://api.spotify.com/v1/tracks/?ids=c,d')
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(len(self.store), 2)
+
+    @patch('requests.Session.request')
+    def test_refresh_bypasses_reads_but_stores(self, mock_request):
+        """With refresh set, fresh entries are refetched and the new body stored."""
+        mock_request.side_effect = [
+            self._response(200, b'{"items": []}', etag='"v1"'),
+            self._response(200, b'{"items": [1]}', etag='"v2"')
+        ]
+
+        self.session.get(self.ALBUMS_URL)
+        self.session.refresh = True
+        second = self.session.get(self.ALBUMS_URL)
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertNotIn('If-None-Match', mock_request.call_args[1]['headers'])
+        self.assertEqual(second.content, b'{"items": [1]}')
+        self.assertEqual(self.store[self.ALBUMS_URL][:2], ('"v2"', b'{"items": [1]}'))
+
+    @patch('requests.Session.request')
+    def test_other_endpoints_untouched(self, mock_request):
+        """Endpoints outside CACHE_TTLS should not be cached."""
+        mock_request.return_value = self._response(200, b'{}', etag='"v1"')
+
+        self.session.get('https://api.spotify.com/v1/me/tracks', params={'limit': 50})
+
+        self.assertEqual(self.store, {})
+        self.assertNotIn('If-None-Match', mock_request.call_args[1]['headers'] or {})
+
+
+class TestSetupLogging(unittest.TestCase):
+    """Test logging configuration."""
+
+    def setUp(self):
+        """Save root handlers so the test leaves logging untouched."""
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+
+    def tearDown(self):
+        """Restore root handlers."""
+        self.root.handlers = self.saved_handlers
+        self.root.setLevel(self.saved_level)
+
+    @patch('artist_tracker.tracker.logging.FileHandler')
+    def test_repeated_setup_replaces_and_closes_handlers(self, mock_file_handler):
+        """Calling setup_logging twice should not stack or leak handlers."""
+        first_file = Mock(level=logging.INFO)
+        mock_file_handler.side_effect = [first_file, Mock(level=logging.INFO)]
+
+        setup_logging()
+        setup_logging(verbose=True)
+
+        self.assertEqual(len(self.root.handlers), 2)
+        first_file.close.assert_called_once()
+
+
+class TestCliParsing(unittest.TestCase):
+    """Test argument parsing in the lightweight CLI module."""
+
+    def test_parse_track_arguments(self):
+        """Track options should parse without loading the tracker."""
+        args = parse_args(['track', '--artist', 'Opeth', '--concurrency', '4', '-f', 'tsv'])
+
+        self.assertEqual(args.command, 'track')
+        self.assertEqual(args.artist, 'Opeth')
+        self.assertEqual(args.workers, 4)
+        self.assertEqual(args.format, 'tsv')
+
+    def test_no_source_prints_help_and_exits(self):
+        """Track without a source should print help instead of running."""
+        with patch('sys.stdout'):
+            with self.assertRaises(SystemExit) as ctx:
+                parse_args(['track'])
+        self.assertEqual(ctx.exception.code, 0)
+
+
+@patch.dict('os.environ', {'SPOTIPY_CLIENT_ID': 'client123', 'SPOTIPY_CLIENT_SECRET': 'secret'})
+@patch('artist_tracker.tracker.cmd_track')
+@patch('artist_tracker.tracker.SpotifyReleaseTracker')
+@patch('artist_tracker.tracker.ArtistDatabase')
+@patch('artist_tracker.tracker.load_dotenv')
+@patch('artist_tracker.tracker.setup_logging')
+class TestRun(unittest.TestCase):
+    """Test wiring of parsed arguments into the tracker."""
+
+    def test_client_credentials_token_cached_per_client(self, mock_logging, mock_dotenv,
+                                                        mock_db, mock_tracker, mock_cmd_track):
+        """The client-credentials token should not share SpotifyOAuth's .cache file."""
+        tracker_module.run(parse_args(['track', '--artist', 'Opeth']))
+
+        auth_manager = mock_tracker.call_args.kwargs['auth_manager']
+        self.assertEqual(auth_manager.cache_handler.cache_path, '.cache-client-client123')
+
+    @patch.dict('os.environ', {'MAX_WORKERS': '0'})
+    def test_invalid_env_workers_names_the_variable(self, mock_logging, mock_dotenv,
+                                                    mock_db, mock_tracker, mock_cmd_track):
+        """A bad MAX_WORKERS should be reported as such, not as --workers."""
+        with self.assertLogs('artist_tracker.tracker', level='ERROR') as logs:
+            with self.assertRaises(SystemExit):
+                tracker_module.run(parse_args(['track', '--artist', 'Opeth']))
+
+        self.assertIn('Invalid value for MAX_WORKERS: 0', logs.output[0])
+        mock_tracker.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()